@@ -6,16 +6,21 @@ Open source alternative to commercial gaming optimization software
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkFont
 import threading
 import sys
 import os
 import time
 import json
 import gc
+import logging
+import logging.handlers
 import weakref
+import asyncio
+import multiprocessing
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Import our modules
 from modules.fps_boost import FPSBoost
@@ -31,6 +36,156 @@ from modules.gaming_optimizer import GamingOptimizer
 from modules.config_manager import ConfigManager
 from modules.settings_dialog import SettingsDialog
 
+# Application log; handlers are attached by _configure_logging when the app runs
+log = logging.getLogger('ngxsmk')
+
+# Log file and its rotation (size in bytes, number of old files kept)
+LOG_FILE = 'ngxsmk_optimizer.log'
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+def _configure_logging():
+    """Send application log records to a rotating file
+    
+    Records are buffered in memory and written in batches (immediately for
+    errors) so UI code paths never block on disk.
+    """
+    if log.handlers:
+        return
+    file_handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES,
+                                                        backupCount=LOG_BACKUP_COUNT,
+                                                        encoding='utf-8', delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
+    log.addHandler(logging.handlers.MemoryHandler(capacity=256, flushLevel=logging.ERROR,
+                                                  target=file_handler))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+# Fixed colors of the feature tab panels (independent of the active theme)
+_PANEL_COLORS = {
+    'panel': '#2d2d2d',
+    'panel_dark': '#1e1e1e',
+    'panel_accent': '#00ff88',
+    'panel_danger': '#ff4444',
+    'panel_muted': '#4d4d4d',
+    'panel_text': 'white',
+    'panel_button_text': 'black'
+}
+
+# Shared encoder for optimizer results (json.dumps builds a new encoder per call)
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, separators=(',', ': '))
+
+# Optimizer profile choices as (value, display label), labels derived once at import
+_ADVANCED_OPTIONS = tuple((v, v.replace('_', ' ').title())
+                          for v in ("gaming", "streaming", "productivity", "balanced"))
+_NETWORK_OPTIONS = tuple((v, v.replace('_', ' ').title())
+                         for v in ("gaming", "streaming", "productivity"))
+_GAMING_OPTIONS = tuple((v, v.replace('_', ' ').title())
+                        for v in ("auto", "league_of_legends", "valorant", "cs2", "fortnite", "apex_legends"))
+
+# Gaming Optimizer feature toggles (all enabled by default)
+_GAMING_FLAGS = ('game_mode', 'anti_cheat_optimization', 'gaming_network', 'gaming_audio')
+
+# Maximum number of lines kept in an appended-to status Text widget
+STATUS_MAX_LINES = 500
+
+# Fonts shared by the tab builders, registered once as named Tk fonts
+_FONT_SPECS = {
+    'h1': ('Arial', 16, 'bold'),
+    'h2': ('Arial', 12, 'bold'),
+    'option': ('Arial', 11, 'bold'),
+    'body': ('Arial', 10),
+    'mono': ('Consolas', 9)
+}
+
+# UI translations, keyed by language code
+_TRANSLATIONS = {
+    'en': {
+        'title': 'NGXSMK GameNet Optimizer',
+        'fps_boost': 'FPS Boost',
+        'network_analyzer': 'Network Analyzer',
+        'multi_internet': 'Multi Internet',
+        'traffic_shaper': 'Traffic Shaper',
+        'ram_cleaner': 'RAM Cleaner',
+        'lol_optimizer': 'LoL Optimizer',
+        'advanced_optimizer': 'Advanced Optimizer',
+        'system_monitor': 'System Monitor',
+        'network_optimizer': 'Network Optimizer',
+        'settings': 'Settings',
+        'status': 'Status',
+        'optimize': 'Optimize',
+        'reset': 'Reset',
+        'start': 'Start',
+        'stop': 'Stop'
+    },
+    'es': {
+        'title': 'NGXSMK GameNet Optimizer',
+        'fps_boost': 'Impulso FPS',
+        'network_analyzer': 'Analizador de Red',
+        'multi_internet': 'Multi Internet',
+        'traffic_shaper': 'Moldeador de Tráfico',
+        'ram_cleaner': 'Limpiador RAM',
+        'lol_optimizer': 'Optimizador LoL',
+        'advanced_optimizer': 'Optimizador Avanzado',
+        'system_monitor': 'Monitor del Sistema',
+        'network_optimizer': 'Optimizador de Red',
+        'settings': 'Configuración',
+        'status': 'Estado',
+        'optimize': 'Optimizar',
+        'reset': 'Restablecer',
+        'start': 'Iniciar',
+        'stop': 'Detener'
+    },
+    'fr': {
+        'title': 'NGXSMK GameNet Optimizer',
+        'fps_boost': 'Boost FPS',
+        'network_analyzer': 'Analyseur Réseau',
+        'multi_internet': 'Multi Internet',
+        'traffic_shaper': 'Formateur de Trafic',
+        'ram_cleaner': 'Nettoyeur RAM',
+        'lol_optimizer': 'Optimiseur LoL',
+        'advanced_optimizer': 'Optimiseur Avancé',
+        'system_monitor': 'Moniteur Système',
+        'network_optimizer': 'Optimiseur Réseau',
+        'settings': 'Paramètres',
+        'status': 'Statut',
+        'optimize': 'Optimiser',
+        'reset': 'Réinitialiser',
+        'start': 'Démarrer',
+        'stop': 'Arrêter'
+    }
+}
+
+# Optimizers run in worker processes: kind -> (class, start method, stop method).
+# The gaming optimizer stays in the app process, where Quick Gaming Mode shares it.
+_OPTIMIZERS = {
+    'advanced': (AdvancedOptimizer, 'start_advanced_optimization', 'stop_optimization'),
+    'network': (NetworkOptimizer, 'start_network_optimization', 'stop_network_optimization')
+}
+
+# Executor.shutdown(cancel_futures=...) was added in Python 3.9
+_CAN_CANCEL_FUTURES = sys.version_info >= (3, 9)
+
+# Optimizer instances living in the worker process, created on first use
+_worker_optimizers = {}
+
+def _get_worker_optimizer(kind):
+    """Return the worker process' optimizer of the given kind"""
+    optimizer = _worker_optimizers.get(kind)
+    if optimizer is None:
+        optimizer = _worker_optimizers[kind] = _OPTIMIZERS[kind][0]()
+    return optimizer
+
+def run_optimization(kind, profile):
+    """Run an optimizer in the worker process and return its results rendered as JSON"""
+    optimizer = _get_worker_optimizer(kind)
+    results = getattr(optimizer, _OPTIMIZERS[kind][1])(profile)
+    return _JSON_ENCODER.encode(results)
+
+def stop_optimization(kind):
+    """Stop an optimizer running in the worker process"""
+    return getattr(_get_worker_optimizer(kind), _OPTIMIZERS[kind][2])()
+
 class NetworkOptimizerApp:
     def __init__(self):
         # Performance optimizations
@@ -39,6 +194,9 @@ class NetworkOptimizerApp:
         self.root = tk.Tk()
         self.root.title("NGXSMK GameNet Optimizer")
         
+        # Named fonts, so widgets share one font instead of registering a tuple each
+        self._fonts = {name: tkFont.Font(root=self.root, font=spec) for name, spec in _FONT_SPECS.items()}
+        
         # Detect system capabilities for low-end PC optimization
         self._detect_system_capabilities()
         
@@ -68,9 +226,30 @@ class NetworkOptimizerApp:
         max_workers = 2 if self.is_low_end_pc else 4
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         
+        # Worker-process optimizers run in their own process per kind, so their
+        # Python work never competes with Tk for the GIL and a Stop never waits
+        # behind another optimizer's Start; created on first use
+        self._proc_executors = {}
+        
         # Weak references for memory management
         self._weak_refs = weakref.WeakSet()
         
+        # Asyncio loop driven cooperatively from the Tk event loop; long
+        # optimizer calls are awaited on the executor so the UI stays responsive
+        self._loop = asyncio.new_event_loop()
+        self._active_tasks = set()
+        self._active_futures = {}  # optimizer kind -> in-flight _run_opt task
+        self._closing = False
+        self._closed = False
+        
+        # Status lines waiting to be appended to Text widgets in one batch
+        self._pending_logs = defaultdict(list)
+        self._log_flush_scheduled = False
+        self._dirty_widgets = set()
+        
+        # Last full text rendered into each Text widget via _set_text
+        self._last_text = {}
+        
         # Center the window on screen
         self.root.update_idletasks()
         width = self.root.winfo_width()
@@ -88,22 +267,51 @@ class NetworkOptimizerApp:
         self.ram_cleaner = RAMCleaner()
         self.lol_optimizer = LoLOptimizer()
         
-        # Initialize advanced modules
-        self.advanced_optimizer = AdvancedOptimizer()
+        # Initialize advanced modules (the advanced and network tabs run theirs in worker processes)
         self.system_monitor = SystemMonitor()
-        self.network_optimizer = NetworkOptimizer()
         self.gaming_optimizer = GamingOptimizer()
         
         # Status variables
         self.is_optimizing = False
         self.optimization_thread = None
         
+        # Gaming feature toggles: one Tcl array (::gaming_flags) initialized in a
+        # single eval, with a BooleanVar bound to each element
+        self.root.tk.eval("array set ::gaming_flags {%s}" % " ".join(f"{name} 1" for name in _GAMING_FLAGS))
+        self._gaming_flags = {name: tk.BooleanVar(master=self.root, name=f"gaming_flags({name})")
+                              for name in _GAMING_FLAGS}
+        
+        # Status text last written by the fullscreen toggles
+        self._last_status_text = None
+        
+        # Currently applied theme/language (None until first applied)
+        self._current_theme = None
+        self._current_language = None
+        
+        # UI widgets referenced by theme/language updates (created in setup_ui)
+        self.main_frame = self.header_frame = self.header_content = None
+        self.title_section = self.controls_section = self.status_frame = None
+        self.logo_label = self.title_label = self.subtitle_label = None
+        self.status_indicator = self.status_text = None
+        self.sidebar_frame = self.sidebar_title = None
+        self.status_indicators = None
+        self.notebook = None
+        
         self.setup_ui()
+        
+        # The UI is built with the dark palette and English text
+        self._current_theme = 'dark'
+        self._current_language = 'en'
+        self.translations = _TRANSLATIONS['en']
+        
         self.load_settings()
         
         # Start performance monitoring
         self._start_performance_monitoring()
         
+        # Start pumping the asyncio loop from Tk
+        self._pump_asyncio()
+        
     def _detect_system_capabilities(self):
         """Detect system capabilities for optimization"""
         try:
@@ -126,11 +334,11 @@ class NetworkOptimizerApp:
             self.reduced_animations = self.is_low_end_pc
             self.minimal_ui = self.is_low_end_pc
             
-            print(f"System detected: {'Low-end PC' if self.is_low_end_pc else 'Standard PC'}")
-            print(f"CPU cores: {cpu_count}, RAM: {memory_gb:.1f}GB")
+            log.info("System detected: %s", 'Low-end PC' if self.is_low_end_pc else 'Standard PC')
+            log.info("CPU cores: %s, RAM: %.1fGB", cpu_count, memory_gb)
             
-        except Exception as e:
-            print(f"System detection failed: {e}")
+        except Exception:
+            log.exception("System detection failed")
             # Default to low-end PC for safety
             self.is_low_end_pc = True
             self.low_resource_mode = True
@@ -174,8 +382,8 @@ class NetworkOptimizerApp:
                         self._last_gc_time = time.time()
                     
                     time.sleep(interval)
-                except Exception as e:
-                    print(f"Performance monitoring error: {e}")
+                except Exception:
+                    log.exception("Performance monitoring error")
                     time.sleep(interval * 2)
         
         # Start monitoring in background thread
@@ -185,7 +393,7 @@ class NetworkOptimizerApp:
     @lru_cache(maxsize=128)
     def _get_optimized_color(self, color_key):
         """Cached color retrieval for better performance"""
-        return self.colors.get(color_key, '#000000')
+        return self.colors.get(color_key) or _PANEL_COLORS.get(color_key, '#000000')
         
     def _optimize_memory_usage(self):
         """Optimize memory usage"""
@@ -201,8 +409,8 @@ class NetworkOptimizerApp:
             if hasattr(self, 'memory_info'):
                 self.update_memory_info()
                 
-        except Exception as e:
-            print(f"Memory optimization error: {e}")
+        except Exception:
+            log.exception("Memory optimization error")
     
     def setup_ui(self):
         """Setup the modern user interface"""
@@ -240,6 +448,19 @@ class NetworkOptimizerApp:
                  background=[('selected', self.colors['accent']),
                            ('active', self.colors['bg_tertiary'])])
         
+        # Configure sidebar button style (shared by all sidebar buttons)
+        style.configure('Sidebar.TButton',
+                       background=self.colors['bg_tertiary'],
+                       foreground=self.colors['text_primary'],
+                       font=('Arial', 16, 'bold'),
+                       padding=[20, 12],
+                       anchor=tk.W,
+                       relief=tk.FLAT,
+                       borderwidth=1)
+        style.map('Sidebar.TButton',
+                 background=[('active', self.colors['accent'])],
+                 foreground=[('active', self.colors['bg_primary'])])
+        
         # Main container with gradient effect
         self.main_frame = tk.Frame(self.root, bg=self.colors['bg_primary'])
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -394,6 +615,14 @@ class NetworkOptimizerApp:
         # Initialize tab frames list
         self.tab_frames = []
         
+        # Tab frames still waiting for a retheme (applied when first shown)
+        self._dirty_tabs = set()
+        
+        # Tabs built on first selection: notebook index -> builder
+        self._lazy_tabs = {}
+        self._built_tabs = set()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
         # Create tabs with modern icons
         self.create_fps_boost_tab()
         self.create_network_analyzer_tab()
@@ -403,8 +632,14 @@ class NetworkOptimizerApp:
         self.create_lol_optimizer_tab()
         self.create_advanced_optimizer_tab()
         self.create_system_monitor_tab()
-        self.create_network_optimizer_tab()
-        self.create_gaming_optimizer_tab()
+        self._add_lazy_tab("🌐 Network Optimizer", self.create_network_optimizer_tab)
+        self._add_lazy_tab("🎮 Gaming Optimizer", self.create_gaming_optimizer_tab)
+    
+    def _add_lazy_tab(self, text, builder):
+        """Add a placeholder tab whose content is built the first time it is selected"""
+        placeholder = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
+        self.notebook.add(placeholder, text=text)
+        self._lazy_tabs[self.notebook.index(placeholder)] = builder
     
     def create_stat_card(self, parent, icon, title, value, row, col):
         """Create a modern stat card"""
@@ -510,8 +745,8 @@ class NetworkOptimizerApp:
                 details
             )
             
-        except Exception as e:
-            print(f"Error completing quick optimization: {e}")
+        except Exception:
+            log.exception("Error completing quick optimization")
     
     def _handle_quick_optimize_error(self, error_msg):
         """Handle quick optimization errors"""
@@ -527,8 +762,8 @@ class NetworkOptimizerApp:
                 "error",
                 f"Error details: {error_msg}"
             )
-        except Exception as e:
-            print(f"Error handling quick optimization error: {e}")
+        except Exception:
+            log.exception("Error handling quick optimization error")
     
     def quick_clean_ram(self):
         """Quick RAM cleanup"""
@@ -577,8 +812,8 @@ class NetworkOptimizerApp:
                 details
             )
             
-        except Exception as e:
-            print(f"Error completing RAM clean: {e}")
+        except Exception:
+            log.exception("Error completing RAM clean")
     
     def _handle_quick_ram_clean_error(self, error_msg):
         """Handle quick RAM cleaning errors"""
@@ -594,8 +829,8 @@ class NetworkOptimizerApp:
                 "error",
                 f"Error details: {error_msg}"
             )
-        except Exception as e:
-            print(f"Error handling RAM clean error: {e}")
+        except Exception:
+            log.exception("Error handling RAM clean error")
     
     def quick_test_network(self):
         """Quick network test"""
@@ -649,8 +884,8 @@ class NetworkOptimizerApp:
                 details
             )
             
-        except Exception as e:
-            print(f"Error completing network test: {e}")
+        except Exception:
+            log.exception("Error completing network test")
     
     def _handle_quick_network_test_error(self, error_msg):
         """Handle quick network test errors"""
@@ -666,8 +901,8 @@ class NetworkOptimizerApp:
                 "error",
                 f"Error details: {error_msg}"
             )
-        except Exception as e:
-            print(f"Error handling network test error: {e}")
+        except Exception:
+            log.exception("Error handling network test error")
     
     def quick_gaming_mode(self):
         """Quick gaming mode activation"""
@@ -723,8 +958,8 @@ class NetworkOptimizerApp:
                 details
             )
             
-        except Exception as e:
-            print(f"Error completing gaming mode: {e}")
+        except Exception:
+            log.exception("Error completing gaming mode")
     
     def _handle_quick_gaming_mode_error(self, error_msg):
         """Handle quick gaming mode errors"""
@@ -740,13 +975,13 @@ class NetworkOptimizerApp:
                 "error",
                 f"Error details: {error_msg}"
             )
-        except Exception as e:
-            print(f"Error handling gaming mode error: {e}")
+        except Exception:
+            log.exception("Error handling gaming mode error")
     
     def optimize_fps(self):
         """Optimize FPS settings"""
         try:
-            print("FPS optimization started...")  # Debug print
+            log.debug("FPS optimization started")
             
             # Update main status if available
             if hasattr(self, 'status_text'):
@@ -756,31 +991,31 @@ class NetworkOptimizerApp:
             
             # Get selected game
             game = self.game_var.get()
-            print(f"Selected game: {game}")  # Debug print
+            log.debug("Selected game: %s", game)
             
             # Run FPS optimization in background thread
             def run_optimization():
                 try:
-                    print("Starting optimization process...")  # Debug print
+                    log.debug("Starting optimization process")
                     
                     # Simulate optimization process
                     import time
                     time.sleep(1)  # Simulate processing time
                     
                     # Run FPS optimization
-                    print("Calling fps_boost.optimize_game_performance...")  # Debug print
+                    log.debug("Calling fps_boost.optimize_game_performance")
                     results = self.fps_boost.optimize_game_performance(
                         priority_boost=self.priority_boost.get(),
                         cpu_optimization=self.cpu_optimization.get(),
                         gpu_optimization=self.gpu_optimization.get()
                     )
-                    print(f"Optimization results: {results}")  # Debug print
+                    log.debug("Optimization results: %s", results)
                     
                     # Update UI in main thread
                     self.root.after(0, lambda: self.update_fps_status(game, results))
                     
                 except Exception as e:
-                    print(f"Error in optimization thread: {e}")  # Debug print
+                    log.exception("Error in optimization thread")
                     self.root.after(0, lambda: self.handle_fps_error(str(e)))
             
             # Start optimization in background
@@ -788,7 +1023,7 @@ class NetworkOptimizerApp:
             threading.Thread(target=run_optimization, daemon=True).start()
             
         except Exception as e:
-            print(f"Error in optimize_fps: {e}")  # Debug print
+            log.exception("Error in optimize_fps")
             self.handle_fps_error(str(e))
     
     def update_fps_status(self, game, results):
@@ -853,13 +1088,13 @@ class NetworkOptimizerApp:
                 f"Error details: {error_msg}"
             )
             
-        except Exception as e:
-            print(f"Failed to handle FPS error: {e}")
+        except Exception:
+            log.exception("Failed to handle FPS error")
     
     def test_fps_optimization(self):
         """Test FPS optimization functionality"""
         try:
-            print("Testing FPS optimization...")
+            log.debug("Testing FPS optimization")
             
             # Update status
             if hasattr(self, 'status_text'):
@@ -905,7 +1140,7 @@ class NetworkOptimizerApp:
             )
             
         except Exception as e:
-            print(f"FPS test error: {e}")
+            log.exception("FPS test error")
             self.fps_status.config(state=tk.NORMAL)
             self.fps_status.delete(1.0, tk.END)
             self.fps_status.insert(tk.END, f"FPS Test Error: {str(e)}")
@@ -1005,21 +1240,11 @@ class NetworkOptimizerApp:
         btn_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
         btn_frame.pack(fill=tk.X, padx=15, pady=5)
         
-        btn = tk.Button(btn_frame, text=f"{icon} {text}", command=command,
-                       font=('Arial', 16, 'bold'), bg=self.colors['bg_tertiary'], 
-                       fg=self.colors['text_primary'], relief=tk.FLAT, bd=1,
-                       padx=20, pady=12, cursor='hand2', anchor=tk.W)
+        # Colors and hover state come from the shared 'Sidebar.TButton' style
+        btn = ttk.Button(btn_frame, text=f"{icon} {text}", command=command,
+                        style='Sidebar.TButton', cursor='hand2')
         btn.pack(fill=tk.X)
         
-        # Hover effects
-        def on_enter(e):
-            btn.config(bg=self.colors['accent'], fg=self.colors['bg_primary'])
-        def on_leave(e):
-            btn.config(bg=self.colors['bg_tertiary'], fg=self.colors['text_primary'])
-        
-        btn.bind('<Enter>', on_enter)
-        btn.bind('<Leave>', on_leave)
-        
         return btn
     
     def create_status_indicator(self, parent, icon, title, value, color):
@@ -1059,8 +1284,8 @@ class NetworkOptimizerApp:
             # Adaptive update interval based on system capabilities
             interval = 2000 if self.is_low_end_pc else 1000  # 2 seconds for low-end PCs
             self.root.after(interval, self.start_status_monitoring)
-        except Exception as e:
-            print(f"Status monitoring error: {e}")
+        except Exception:
+            log.exception("Status monitoring error")
             # Retry after a longer interval
             self.root.after(5000, self.start_status_monitoring)
     
@@ -1077,7 +1302,8 @@ class NetworkOptimizerApp:
                     'cpu_percent': psutil.cpu_percent(interval=0.1),
                     'time': time.time()
                 }
-                print(f"Updated metrics: RAM {self._last_metrics['memory'].percent:.1f}%, CPU {self._last_metrics['cpu_percent']:.1f}%")  # Debug print
+                log.debug("Updated metrics: RAM %.1f%%, CPU %.1f%%",
+                          self._last_metrics['memory'].percent, self._last_metrics['cpu_percent'])
             
             metrics = self._last_metrics
             
@@ -1098,10 +1324,8 @@ class NetworkOptimizerApp:
             if hasattr(self, 'status_text'):
                 self.status_text.config(text=f"RAM: {metrics['memory'].percent:.1f}% | CPU: {metrics['cpu_percent']:.1f}%", fg=self.colors['text_primary'])
             
-        except Exception as e:
-            print(f"Status update error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Status update error")
     
     def _get_status_color(self, value, thresholds):
         """Get status color based on value and thresholds"""
@@ -1124,9 +1348,9 @@ class NetworkOptimizerApp:
                         if 'icon_label' in indicator:
                             indicator['icon_label'].config(fg=color)
                     else:
-                        print(f"Invalid indicator structure for {indicator_name}")
+                        log.warning("Invalid indicator structure for %s", indicator_name)
                 else:
-                    print(f"Status indicator {indicator_name} not found")
+                    log.warning("Status indicator %s not found", indicator_name)
             
             # Update Network status separately
             try:
@@ -1146,10 +1370,8 @@ class NetworkOptimizerApp:
                     if 'icon_label' in self.network_status_indicator:
                         self.network_status_indicator['icon_label'].config(fg=network_color)
             
-        except Exception as e:
-            print(f"Batch status update error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Batch status update error")
         
     def create_fps_boost_tab(self):
         """Create modern FPS Boost tab"""
@@ -1282,60 +1504,74 @@ class NetworkOptimizerApp:
         
     def create_network_analyzer_tab(self):
         """Create modern Network Analyzer tab"""
+        # Panel colors (cached lookups)
+        panel = self._get_optimized_color('panel')
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_danger = self._get_optimized_color('panel_danger')
+        panel_text = self._get_optimized_color('panel_text')
+        panel_button_text = self._get_optimized_color('panel_button_text')
+        
         net_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
         self.notebook.add(net_frame, text="🌐 Network Analyzer")
         
         # Network Analyzer content
         net_title = tk.Label(net_frame, text="Network Performance Analyzer", 
-                            font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+                            font=('Arial', 16, 'bold'), fg=panel_accent, bg=panel_dark)
         net_title.pack(pady=20)
         
         # Controls
-        controls_frame = tk.Frame(net_frame, bg='#1e1e1e')
+        controls_frame = tk.Frame(net_frame, bg=panel_dark)
         controls_frame.pack(fill=tk.X, padx=20, pady=10)
         
         self.start_analysis_btn = tk.Button(controls_frame, text="Start Analysis", 
                                            command=self.start_network_analysis,
-                                           bg='#00ff88', fg='black', font=('Arial', 12, 'bold'),
+                                           bg=panel_accent, fg=panel_button_text, font=('Arial', 12, 'bold'),
                                            padx=20, pady=5, relief=tk.FLAT)
         self.start_analysis_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         self.stop_analysis_btn = tk.Button(controls_frame, text="Stop Analysis", 
                                           command=self.stop_network_analysis,
-                                          bg='#ff4444', fg='white', font=('Arial', 12, 'bold'),
+                                          bg=panel_danger, fg=panel_text, font=('Arial', 12, 'bold'),
                                           padx=20, pady=5, relief=tk.FLAT, state=tk.DISABLED)
         self.stop_analysis_btn.pack(side=tk.LEFT)
         
         # Results display
-        results_frame = tk.Frame(net_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        results_frame = tk.Frame(net_frame, bg=panel, relief=tk.RAISED, bd=1)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
         tk.Label(results_frame, text="Network Analysis Results:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
+                fg=panel_text, bg=panel).pack(anchor=tk.W, padx=10, pady=5)
         
-        self.network_results = tk.Text(results_frame, height=12, bg='#1e1e1e', fg='#00ff88',
+        self.network_results = tk.Text(results_frame, height=12, bg=panel_dark, fg=panel_accent,
                                       font=('Consolas', 10), state=tk.DISABLED)
         self.network_results.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
     def create_multi_internet_tab(self):
         """Create modern Multi Internet tab"""
+        # Panel colors (cached lookups)
+        panel = self._get_optimized_color('panel')
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_text = self._get_optimized_color('panel_text')
+        
         multi_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
         self.notebook.add(multi_frame, text="🔗 Multi Internet")
         
         # Multi Internet content
         multi_title = tk.Label(multi_frame, text="Multi-Connection Manager", 
-                              font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+                              font=('Arial', 16, 'bold'), fg=panel_accent, bg=panel_dark)
         multi_title.pack(pady=20)
         
         # Connection list
-        conn_frame = tk.Frame(multi_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        conn_frame = tk.Frame(multi_frame, bg=panel, relief=tk.RAISED, bd=1)
         conn_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
         tk.Label(conn_frame, text="Available Connections:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
+                fg=panel_text, bg=panel).pack(anchor=tk.W, padx=10, pady=5)
         
-        self.connection_list = tk.Listbox(conn_frame, bg='#1e1e1e', fg='white',
-                                         font=('Consolas', 10), selectbackground='#00ff88')
+        self.connection_list = tk.Listbox(conn_frame, bg=panel_dark, fg=panel_text,
+                                         font=('Consolas', 10), selectbackground=panel_accent)
         self.connection_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         # Load connections
@@ -1343,20 +1579,25 @@ class NetworkOptimizerApp:
         
     def create_traffic_shaper_tab(self):
         """Create modern Traffic Shaper tab"""
+        # Panel colors (cached lookups)
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_text = self._get_optimized_color('panel_text')
+        
         traffic_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
         self.notebook.add(traffic_frame, text="🚦 Traffic Shaper")
         
         # Traffic Shaper content
         traffic_title = tk.Label(traffic_frame, text="Traffic Shaping & Bandwidth Control", 
-                                font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+                                font=('Arial', 16, 'bold'), fg=panel_accent, bg=panel_dark)
         traffic_title.pack(pady=20)
         
         # Bandwidth controls
-        bw_frame = tk.Frame(traffic_frame, bg='#1e1e1e')
+        bw_frame = tk.Frame(traffic_frame, bg=panel_dark)
         bw_frame.pack(fill=tk.X, padx=20, pady=10)
         
         tk.Label(bw_frame, text="Bandwidth Limit (Mbps):", font=('Arial', 12),
-                fg='white', bg='#1e1e1e').pack(side=tk.LEFT)
+                fg=panel_text, bg=panel_dark).pack(side=tk.LEFT)
         
         self.bandwidth_var = tk.StringVar(value="100")
         bandwidth_entry = tk.Entry(bw_frame, textvariable=self.bandwidth_var, 
@@ -1364,89 +1605,104 @@ class NetworkOptimizerApp:
         bandwidth_entry.pack(side=tk.LEFT, padx=(10, 0))
         
         # Traffic shaping options
-        shaping_frame = tk.Frame(traffic_frame, bg='#1e1e1e')
+        shaping_frame = tk.Frame(traffic_frame, bg=panel_dark)
         shaping_frame.pack(fill=tk.X, padx=20, pady=20)
         
         self.prioritize_gaming = tk.BooleanVar(value=True)
         tk.Checkbutton(shaping_frame, text="Prioritize Gaming Traffic", variable=self.prioritize_gaming,
-                      fg='white', bg='#1e1e1e', selectcolor='#00ff88').pack(anchor=tk.W)
+                      fg=panel_text, bg=panel_dark, selectcolor=panel_accent).pack(anchor=tk.W)
         
         self.limit_background = tk.BooleanVar(value=True)
         tk.Checkbutton(shaping_frame, text="Limit Background Applications", variable=self.limit_background,
-                      fg='white', bg='#1e1e1e', selectcolor='#00ff88').pack(anchor=tk.W)
+                      fg=panel_text, bg=panel_dark, selectcolor=panel_accent).pack(anchor=tk.W)
         
     def create_ram_cleaner_tab(self):
         """Create modern RAM Cleaner tab"""
+        # Panel colors (cached lookups)
+        panel = self._get_optimized_color('panel')
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_text = self._get_optimized_color('panel_text')
+        panel_button_text = self._get_optimized_color('panel_button_text')
+        
         ram_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
         self.notebook.add(ram_frame, text="🧹 RAM Cleaner")
         
         # RAM Cleaner content
         ram_title = tk.Label(ram_frame, text="Memory Optimization & RAM Cleaner", 
-                            font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+                            font=('Arial', 16, 'bold'), fg=panel_accent, bg=panel_dark)
         ram_title.pack(pady=20)
         
         # Memory info
-        mem_info_frame = tk.Frame(ram_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        mem_info_frame = tk.Frame(ram_frame, bg=panel, relief=tk.RAISED, bd=1)
         mem_info_frame.pack(fill=tk.X, padx=20, pady=10)
         
         tk.Label(mem_info_frame, text="Memory Status:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
+                fg=panel_text, bg=panel).pack(anchor=tk.W, padx=10, pady=5)
         
-        self.memory_info = tk.Text(mem_info_frame, height=6, bg='#1e1e1e', fg='#00ff88',
+        self.memory_info = tk.Text(mem_info_frame, height=6, bg=panel_dark, fg=panel_accent,
                                   font=('Consolas', 10), state=tk.DISABLED)
         self.memory_info.pack(fill=tk.X, padx=10, pady=5)
         
         # Cleaner controls
-        clean_frame = tk.Frame(ram_frame, bg='#1e1e1e')
+        clean_frame = tk.Frame(ram_frame, bg=panel_dark)
         clean_frame.pack(fill=tk.X, padx=20, pady=10)
         
         self.clean_ram_btn = tk.Button(clean_frame, text="Clean RAM", 
                                       command=self.clean_ram,
-                                      bg='#00ff88', fg='black', font=('Arial', 12, 'bold'),
+                                      bg=panel_accent, fg=panel_button_text, font=('Arial', 12, 'bold'),
                                       padx=20, pady=10, relief=tk.FLAT)
         self.clean_ram_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         self.auto_clean = tk.BooleanVar(value=False)
         tk.Checkbutton(clean_frame, text="Auto-clean every 5 minutes", variable=self.auto_clean,
-                      fg='white', bg='#1e1e1e', selectcolor='#00ff88').pack(side=tk.LEFT, padx=(20, 0))
+                      fg=panel_text, bg=panel_dark, selectcolor=panel_accent).pack(side=tk.LEFT, padx=(20, 0))
         
         # Update memory info
         self.update_memory_info()
         
     def create_lol_optimizer_tab(self):
         """Create modern League of Legends Optimizer tab"""
+        # Panel colors (cached lookups)
+        panel = self._get_optimized_color('panel')
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_muted = self._get_optimized_color('panel_muted')
+        panel_text = self._get_optimized_color('panel_text')
+        panel_button_text = self._get_optimized_color('panel_button_text')
+        
         lol_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
         self.notebook.add(lol_frame, text="⚔️ LoL Optimizer")
         
         # LoL Optimizer content
         lol_title = tk.Label(lol_frame, text="League of Legends Optimizer", 
-                            font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+                            font=('Arial', 16, 'bold'), fg=panel_accent, bg=panel_dark)
         lol_title.pack(pady=20)
         
         # LoL-specific controls
-        controls_frame = tk.Frame(lol_frame, bg='#1e1e1e')
+        controls_frame = tk.Frame(lol_frame, bg=panel_dark)
         controls_frame.pack(fill=tk.X, padx=20, pady=10)
         
         self.optimize_lol_btn = tk.Button(controls_frame, text="Optimize LoL", 
                                         command=self.optimize_lol,
-                                        bg='#00ff88', fg='black', font=('Arial', 12, 'bold'),
+                                        bg=panel_accent, fg=panel_button_text, font=('Arial', 12, 'bold'),
                                         padx=20, pady=5, relief=tk.FLAT)
         self.optimize_lol_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         self.test_lol_latency_btn = tk.Button(controls_frame, text="Test Server Latency", 
                                              command=self.test_lol_latency,
-                                             bg='#4d4d4d', fg='white', font=('Arial', 12),
+                                             bg=panel_muted, fg=panel_text, font=('Arial', 12),
                                              padx=20, pady=5, relief=tk.FLAT)
         self.test_lol_latency_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # LoL performance display
-        perf_frame = tk.Frame(lol_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        perf_frame = tk.Frame(lol_frame, bg=panel, relief=tk.RAISED, bd=1)
         perf_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
         tk.Label(perf_frame, text="LoL Performance Status:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
+                fg=panel_text, bg=panel).pack(anchor=tk.W, padx=10, pady=5)
         
-        self.lol_status = tk.Text(perf_frame, height=10, bg='#1e1e1e', fg='#00ff88',
+        self.lol_status = tk.Text(perf_frame, height=10, bg=panel_dark, fg=panel_accent,
                                  font=('Consolas', 10), state=tk.DISABLED)
         self.lol_status.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
@@ -1551,8 +1807,8 @@ class NetworkOptimizerApp:
             self.lol_status.insert(tk.END, status_text)
             self.lol_status.config(state=tk.DISABLED)
             
-        except Exception as e:
-            print(f"Failed to update LoL status: {e}")
+        except Exception:
+            log.exception("Failed to update LoL status")
         
     
     def open_settings(self):
@@ -1670,9 +1926,9 @@ class NetworkOptimizerApp:
                 self.status_indicator.config(fg=self.colors['warning'])
             
             # Clean RAM memory
-            print("Starting RAM cleaning...")  # Debug print
+            log.debug("Starting RAM cleaning")
             freed_memory = self.ram_cleaner.clean_memory()
-            print(f"RAM cleaning completed, freed: {freed_memory:.2f} MB")  # Debug print
+            log.debug("RAM cleaning completed, freed: %.2f MB", freed_memory)
             
             # Update memory info
             self.update_memory_info()
@@ -1699,7 +1955,7 @@ class NetworkOptimizerApp:
             )
             
         except Exception as e:
-            print(f"RAM cleaning error: {e}")  # Debug print
+            log.exception("RAM cleaning error")
             
             # Update status if available
             if hasattr(self, 'status_text'):
@@ -1737,8 +1993,8 @@ class NetworkOptimizerApp:
             if hasattr(self, 'status_text'):
                 self.status_text.config(text=f"RAM: {memory_info['memory_percent']:.1f}%", fg=self.colors['text_primary'])
                 
-        except Exception as e:
-            print(f"Failed to update memory info: {e}")
+        except Exception:
+            log.exception("Failed to update memory info")
             
     def open_settings(self):
         """Open settings dialog"""
@@ -1999,23 +2255,27 @@ class NetworkOptimizerApp:
         try:
             settings = self.config_manager.load_settings()
             
-            # Apply theme
-            theme = settings.get('general', {}).get('theme', 'dark')
-            self.apply_theme(theme)
+            general = settings.get('general', {})
+            
+            # Apply theme (skipped when it is already active, e.g. the default)
+            theme = general.get('theme', 'dark')
+            if theme != self._current_theme:
+                self.apply_theme(theme)
             
             # Apply language
-            language = settings.get('general', {}).get('language', 'en')
-            self.apply_language(language)
+            language = general.get('language', 'en')
+            if language != self._current_language:
+                self.apply_language(language)
             
-            # Apply low-resource mode if enabled
-            if settings.get('general', {}).get('low_resource_mode', False):
+            # Apply low-resource mode if enabled and not already active
+            if general.get('low_resource_mode', False) and not self.low_resource_mode:
                 self.enable_low_resource_mode()
             
             # Apply other settings
             self.apply_other_settings(settings)
             
-        except Exception as e:
-            print(f"Failed to load settings: {e}")
+        except Exception:
+            log.exception("Failed to load settings")
     
     def enable_low_resource_mode(self):
         """Enable low-resource mode for better performance on low-end PCs"""
@@ -2029,13 +2289,16 @@ class NetworkOptimizerApp:
                 # Restart monitoring with reduced frequency
                 pass
             
-            print("Low-resource mode enabled")
+            log.info("Low-resource mode enabled")
             
-        except Exception as e:
-            print(f"Failed to enable low-resource mode: {e}")
+        except Exception:
+            log.exception("Failed to enable low-resource mode")
     
     def apply_theme(self, theme):
         """Apply theme to the application"""
+        if theme == self._current_theme:
+            return
+        
         try:
             if theme == 'light':
                 self.colors = {
@@ -2083,81 +2346,31 @@ class NetworkOptimizerApp:
                     'border': '#333333'
                 }
             
+            # Drop colors cached for the previous palette
+            self._get_optimized_color.cache_clear()
+            
             # Update UI colors
             self.update_ui_colors()
+            self._current_theme = theme
             
-        except Exception as e:
-            print(f"Failed to apply theme: {e}")
+        except Exception:
+            log.exception("Failed to apply theme")
     
     def apply_language(self, language):
         """Apply language to the application"""
+        if language == self._current_language:
+            return
+        
         try:
-            # Language translations
-            translations = {
-                'en': {
-                    'title': 'NGXSMK GameNet Optimizer',
-                    'fps_boost': 'FPS Boost',
-                    'network_analyzer': 'Network Analyzer',
-                    'multi_internet': 'Multi Internet',
-                    'traffic_shaper': 'Traffic Shaper',
-                    'ram_cleaner': 'RAM Cleaner',
-                    'lol_optimizer': 'LoL Optimizer',
-                    'advanced_optimizer': 'Advanced Optimizer',
-                    'system_monitor': 'System Monitor',
-                    'network_optimizer': 'Network Optimizer',
-                    'settings': 'Settings',
-                    'status': 'Status',
-                    'optimize': 'Optimize',
-                    'reset': 'Reset',
-                    'start': 'Start',
-                    'stop': 'Stop'
-                },
-                'es': {
-                    'title': 'NGXSMK GameNet Optimizer',
-                    'fps_boost': 'Impulso FPS',
-                    'network_analyzer': 'Analizador de Red',
-                    'multi_internet': 'Multi Internet',
-                    'traffic_shaper': 'Moldeador de Tráfico',
-                    'ram_cleaner': 'Limpiador RAM',
-                    'lol_optimizer': 'Optimizador LoL',
-                    'advanced_optimizer': 'Optimizador Avanzado',
-                    'system_monitor': 'Monitor del Sistema',
-                    'network_optimizer': 'Optimizador de Red',
-                    'settings': 'Configuración',
-                    'status': 'Estado',
-                    'optimize': 'Optimizar',
-                    'reset': 'Restablecer',
-                    'start': 'Iniciar',
-                    'stop': 'Detener'
-                },
-                'fr': {
-                    'title': 'NGXSMK GameNet Optimizer',
-                    'fps_boost': 'Boost FPS',
-                    'network_analyzer': 'Analyseur Réseau',
-                    'multi_internet': 'Multi Internet',
-                    'traffic_shaper': 'Formateur de Trafic',
-                    'ram_cleaner': 'Nettoyeur RAM',
-                    'lol_optimizer': 'Optimiseur LoL',
-                    'advanced_optimizer': 'Optimiseur Avancé',
-                    'system_monitor': 'Moniteur Système',
-                    'network_optimizer': 'Optimiseur Réseau',
-                    'settings': 'Paramètres',
-                    'status': 'Statut',
-                    'optimize': 'Optimiser',
-                    'reset': 'Réinitialiser',
-                    'start': 'Démarrer',
-                    'stop': 'Arrêter'
-                }
-            }
-            
             # Get translations for current language
-            self.translations = translations.get(language, translations['en'])
+            self.translations = _TRANSLATIONS.get(language, _TRANSLATIONS['en'])
             
             # Update UI text
             self.update_ui_text()
+            self._current_language = language
             
-        except Exception as e:
-            print(f"Failed to apply language: {e}")
+        except Exception:
+            log.exception("Failed to apply language")
     
     def apply_other_settings(self, settings):
         """Apply other settings to the application"""
@@ -2167,12 +2380,18 @@ class NetworkOptimizerApp:
             start_minimized = settings.get('general', {}).get('start_minimized', False)
             auto_optimize = settings.get('general', {}).get('auto_optimize', False)
             
+            # Restore gaming feature toggles
+            for name, value in settings.get('gaming_optimizer', {}).items():
+                var = self._gaming_flags.get(name)
+                if var is not None:
+                    var.set(bool(value))
+            
             # Apply auto-optimize if enabled
             if auto_optimize:
                 self.auto_optimize_on_startup()
             
-        except Exception as e:
-            print(f"Failed to apply other settings: {e}")
+        except Exception:
+            log.exception("Failed to apply other settings")
     
     def update_ui_colors(self):
         """Update UI colors based on current theme - Optimized version"""
@@ -2190,39 +2409,37 @@ class NetworkOptimizerApp:
             # Batch UI updates for better performance
             self._batch_update_colors({
                 'root': (self.root, {'bg': bg_primary}),
-                'main_frame': (getattr(self, 'main_frame', None), {'bg': bg_primary}),
-                'header_frame': (getattr(self, 'header_frame', None), {'bg': bg_secondary}),
-                'header_content': (getattr(self, 'header_content', None), {'bg': bg_secondary}),
-                'title_section': (getattr(self, 'title_section', None), {'bg': bg_secondary}),
-                'controls_section': (getattr(self, 'controls_section', None), {'bg': bg_secondary}),
-                'status_frame': (getattr(self, 'status_frame', None), {'bg': bg_secondary}),
-                'logo_label': (getattr(self, 'logo_label', None), {'fg': accent, 'bg': bg_secondary}),
-                'title_label': (getattr(self, 'title_label', None), {'fg': text_primary, 'bg': bg_secondary}),
-                'subtitle_label': (getattr(self, 'subtitle_label', None), {'fg': text_muted, 'bg': bg_secondary}),
-                'status_indicator': (getattr(self, 'status_indicator', None), {'fg': success, 'bg': bg_secondary}),
-                'status_text': (getattr(self, 'status_text', None), {'fg': text_primary, 'bg': bg_secondary}),
-                'sidebar_frame': (getattr(self, 'sidebar_frame', None), {'bg': bg_secondary}),
-                'sidebar_title': (getattr(self, 'sidebar_title', None), {'fg': text_primary, 'bg': bg_secondary})
+                'main_frame': (self.main_frame, {'bg': bg_primary}),
+                'header_frame': (self.header_frame, {'bg': bg_secondary}),
+                'header_content': (self.header_content, {'bg': bg_secondary}),
+                'title_section': (self.title_section, {'bg': bg_secondary}),
+                'controls_section': (self.controls_section, {'bg': bg_secondary}),
+                'status_frame': (self.status_frame, {'bg': bg_secondary}),
+                'logo_label': (self.logo_label, {'fg': accent, 'bg': bg_secondary}),
+                'title_label': (self.title_label, {'fg': text_primary, 'bg': bg_secondary}),
+                'subtitle_label': (self.subtitle_label, {'fg': text_muted, 'bg': bg_secondary}),
+                'status_indicator': (self.status_indicator, {'fg': success, 'bg': bg_secondary}),
+                'status_text': (self.status_text, {'fg': text_primary, 'bg': bg_secondary}),
+                'sidebar_frame': (self.sidebar_frame, {'bg': bg_secondary}),
+                'sidebar_title': (self.sidebar_title, {'fg': text_primary, 'bg': bg_secondary})
             })
             
-            # Update sidebar buttons efficiently
-            if hasattr(self, 'sidebar_buttons'):
-                for btn in self.sidebar_buttons:
-                    btn.configure(bg=bg_tertiary, fg=text_primary)
-            
             # Update status indicators efficiently
-            if hasattr(self, 'status_indicators'):
+            if self.status_indicators is not None:
                 for indicator in self.status_indicators:
                     indicator.configure(bg=bg_tertiary)
             
             # Update notebook styles efficiently
             self._update_notebook_styles(bg_secondary, bg_tertiary, text_primary, accent, accent_hover)
             
+            # Sidebar buttons pick up the new colors through their shared style
+            self._update_button_style(bg_primary, bg_tertiary, text_primary, accent)
+            
             # Update tab content frames
             self.update_tab_colors()
             
-        except Exception as e:
-            print(f"Failed to update UI colors: {e}")
+        except Exception:
+            log.exception("Failed to update UI colors")
     
     def _batch_update_colors(self, updates):
         """Batch update colors for better performance"""
@@ -2230,8 +2447,8 @@ class NetworkOptimizerApp:
             if widget is not None:
                 try:
                     widget.configure(**config)
-                except Exception as e:
-                    print(f"Failed to update {name}: {e}")
+                except Exception:
+                    log.exception("Failed to update %s", name)
     
     def _update_notebook_styles(self, bg_secondary, bg_tertiary, text_primary, accent, accent_hover):
         """Update notebook styles efficiently"""
@@ -2258,21 +2475,65 @@ class NetworkOptimizerApp:
             style.map('Modern.TButton',
                      background=[('active', accent),
                                 ('pressed', accent_hover)])
-        except Exception as e:
-            print(f"Failed to update notebook styles: {e}")
+        except Exception:
+            log.exception("Failed to update notebook styles")
+    
+    def _update_button_style(self, bg_primary, bg_tertiary, text_primary, accent):
+        """Update the shared sidebar button style in a single call"""
+        try:
+            style = ttk.Style()
+            style.configure('Sidebar.TButton',
+                           background=bg_tertiary,
+                           foreground=text_primary)
+            style.map('Sidebar.TButton',
+                     background=[('active', accent)],
+                     foreground=[('active', bg_primary)])
+        except Exception:
+            log.exception("Failed to update button style")
     
     def update_tab_colors(self):
-        """Update colors for all tab content"""
+        """Update colors for the visible tab and defer the hidden ones"""
         try:
-            # Update all tab frames
-            for tab_frame in self.tab_frames:
-                tab_frame.configure(bg=self.colors['bg_primary'])
-                
-                # Update all widgets in the tab
-                self.update_widget_colors(tab_frame)
+            # Hidden tabs are rethemed lazily when they are selected
+            self._dirty_tabs = set(self.tab_frames)
+            
+            selected = self._get_selected_tab()
+            if selected in self._dirty_tabs:
+                self._dirty_tabs.discard(selected)
+                self._apply_tab_colors(selected)
                 
-        except Exception as e:
-            print(f"Failed to update tab colors: {e}")
+        except Exception:
+            log.exception("Failed to update tab colors")
+    
+    def _get_selected_tab(self):
+        """Return the frame of the currently selected notebook tab"""
+        tab_id = self.notebook.select()
+        return self.notebook.nametowidget(tab_id) if tab_id else None
+    
+    def _apply_tab_colors(self, tab_frame):
+        """Apply current theme colors to a single tab frame"""
+        tab_frame.configure(bg=self.colors['bg_primary'])
+        
+        # Update all widgets in the tab
+        self.update_widget_colors(tab_frame)
+    
+    def _on_tab_changed(self, event=None):
+        """Build lazy tabs on first selection and retheme tabs shown after a theme change"""
+        try:
+            selected = self._get_selected_tab()
+            if selected is None:
+                return
+            
+            index = self.notebook.index(selected)
+            if index not in self._built_tabs and index in self._lazy_tabs:
+                self._built_tabs.add(index)
+                self._lazy_tabs.pop(index)(selected)
+            
+            if selected in self._dirty_tabs:
+                self._dirty_tabs.discard(selected)
+                self._apply_tab_colors(selected)
+        except Exception:
+            log.exception("Failed to handle tab change")
     
     def update_widget_colors(self, parent):
         """Recursively update widget colors"""
@@ -2291,8 +2552,8 @@ class NetworkOptimizerApp:
                 elif isinstance(child, tk.Scrollbar):
                     child.configure(bg=self.colors['bg_tertiary'])
                     
-        except Exception as e:
-            print(f"Failed to update widget colors: {e}")
+        except Exception:
+            log.exception("Failed to update widget colors")
     
     def update_ui_text(self):
         """Update UI text based on current language"""
@@ -2301,15 +2562,15 @@ class NetworkOptimizerApp:
             self.root.title(self.translations.get('title', 'NGXSMK GameNet Optimizer'))
             
             # Update title and subtitle
-            if hasattr(self, 'title_label'):
+            if self.title_label is not None:
                 self.title_label.configure(text=self.translations.get('title', 'NGXSMK GameNet Optimizer'))
             
             # Update status text
-            if hasattr(self, 'status_text'):
+            if self.status_text is not None:
                 self.status_text.configure(text=self.translations.get('status', 'System Ready'))
             
             # Update notebook tabs
-            if hasattr(self, 'notebook'):
+            if self.notebook is not None:
                 for i, tab_id in enumerate(self.notebook.tabs()):
                     tab_text = self.notebook.tab(tab_id, 'text')
                     # Map tab text to translations
@@ -2328,8 +2589,8 @@ class NetworkOptimizerApp:
                     if tab_text in tab_mapping:
                         self.notebook.tab(tab_id, text=tab_mapping[tab_text])
             
-        except Exception as e:
-            print(f"Failed to update UI text: {e}")
+        except Exception:
+            log.exception("Failed to update UI text")
     
     def auto_optimize_on_startup(self):
         """Auto-optimize on startup if enabled"""
@@ -2337,8 +2598,8 @@ class NetworkOptimizerApp:
             # Start background optimization
             self.optimization_thread = threading.Thread(target=self._auto_optimize_loop, daemon=True)
             self.optimization_thread.start()
-        except Exception as e:
-            print(f"Failed to start auto-optimization: {e}")
+        except Exception:
+            log.exception("Failed to start auto-optimization")
     
     def _auto_optimize_loop(self):
         """Auto-optimization loop"""
@@ -2348,330 +2609,479 @@ class NetworkOptimizerApp:
                 self.fps_boost.optimize_fps()
                 self.ram_cleaner.clean_ram()
                 time.sleep(300)  # Optimize every 5 minutes
-        except Exception as e:
-            print(f"Auto-optimization error: {e}")
+        except Exception:
+            log.exception("Auto-optimization error")
             
     def save_settings(self):
         """Save application settings"""
         try:
-            settings = {
-                'fps_boost': {
-                    'priority_boost': self.priority_boost.get(),
-                    'cpu_optimization': self.cpu_optimization.get(),
-                    'gpu_optimization': self.gpu_optimization.get()
-                },
-                'traffic_shaper': {
-                    'prioritize_gaming': self.prioritize_gaming.get(),
-                    'limit_background': self.limit_background.get()
-                },
-                'ram_cleaner': {
-                    'auto_clean': self.auto_clean.get()
-                }
-            }
-            self.config_manager.save_settings(settings)
-        except Exception as e:
-            print(f"Failed to save settings: {e}")
+            self.config_manager.save_settings(self._collect_settings())
+        except Exception:
+            log.exception("Failed to save settings")
+    
+    def _collect_settings(self):
+        """Collect current UI settings (must run on the Tk thread)"""
+        settings = {
+            'fps_boost': {
+                'priority_boost': self.priority_boost.get(),
+                'cpu_optimization': self.cpu_optimization.get(),
+                'gpu_optimization': self.gpu_optimization.get()
+            },
+            'traffic_shaper': {
+                'prioritize_gaming': self.prioritize_gaming.get(),
+                'limit_background': self.limit_background.get()
+            },
+            'ram_cleaner': {
+                'auto_clean': self.auto_clean.get()
+            },
+            'gaming_optimizer': {name: var.get() for name, var in self._gaming_flags.items()}
+        }
+        return settings
             
     def create_advanced_optimizer_tab(self):
         """Create modern Advanced Optimizer tab"""
-        advanced_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
-        self.notebook.add(advanced_frame, text="🤖 Advanced AI")
-        
-        # Title
-        title_label = tk.Label(advanced_frame, text="🚀 Advanced AI Optimizer", 
-                              font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
-        title_label.pack(pady=20)
-        
-        # Profile selection
-        profile_frame = tk.Frame(advanced_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
-        profile_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        tk.Label(profile_frame, text="Optimization Profile:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.advanced_profile = tk.StringVar(value="gaming")
-        profile_options = ["gaming", "streaming", "productivity", "balanced"]
-        
-        for i, option in enumerate(profile_options):
-            rb = self.create_modern_radiobutton(profile_frame, option.title(), 
-                                               self.advanced_profile, option, 0, i)
-        
-        # Advanced features
-        features_frame = tk.Frame(advanced_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
-        features_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        tk.Label(features_frame, text="Advanced Features:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
+        # Feature toggles
         self.ai_analysis = tk.BooleanVar(value=True)
         self.real_time_monitoring = tk.BooleanVar(value=True)
         self.predictive_optimization = tk.BooleanVar(value=True)
         self.adaptive_learning = tk.BooleanVar(value=True)
         
-        features = [
-            ("AI-Powered Analysis", self.ai_analysis),
-            ("Real-time Monitoring", self.real_time_monitoring),
-            ("Predictive Optimization", self.predictive_optimization),
-            ("Adaptive Learning", self.adaptive_learning)
-        ]
-        
-        for feature, var in features:
-            cb = tk.Checkbutton(features_frame, text=feature, variable=var,
-                               font=('Arial', 10), fg='white', bg='#2d2d2d',
-                               selectcolor='#00ff88', activebackground='#2d2d2d')
-            cb.pack(anchor=tk.W, padx=20, pady=2)
-        
-        # Control buttons
-        button_frame = tk.Frame(advanced_frame, bg='#1e1e1e')
-        button_frame.pack(pady=20)
-        
-        self.start_advanced_btn = tk.Button(button_frame, text="🚀 Start Advanced Optimization",
-                                           command=self.start_advanced_optimization,
-                                           font=('Arial', 12, 'bold'), bg='#00ff88', fg='black',
-                                           relief=tk.RAISED, bd=3, padx=20, pady=10)
-        self.start_advanced_btn.pack(side=tk.LEFT, padx=10)
-        
-        self.stop_advanced_btn = tk.Button(button_frame, text="⏹️ Stop Optimization",
-                                          command=self.stop_advanced_optimization,
-                                          font=('Arial', 12, 'bold'), bg='#ff4444', fg='white',
-                                          relief=tk.RAISED, bd=3, padx=20, pady=10, state=tk.DISABLED)
-        self.stop_advanced_btn.pack(side=tk.LEFT, padx=10)
-        
-        # Results display
-        results_frame = tk.Frame(advanced_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
-        results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        tk.Label(results_frame, text="Advanced Optimization Results:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.advanced_results = tk.Text(results_frame, height=15, bg='#1e1e1e', fg='#00ff88',
-                                       font=('Consolas', 9), state=tk.DISABLED, wrap=tk.WORD)
-        
-        # Scrollbar for results
-        results_scrollbar = tk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.advanced_results.yview)
-        self.advanced_results.configure(yscrollcommand=results_scrollbar.set)
-        
-        self.advanced_results.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self._build_optimizer_tab({
+            'key': 'advanced',
+            'tab_text': "🤖 Advanced AI",
+            'title': "🚀 Advanced AI Optimizer",
+            'profile_label': "Optimization Profile:",
+            'profile_attr': 'advanced_profile',
+            'profile_default': "gaming",
+            'options': _ADVANCED_OPTIONS,
+            'features_label': "Advanced Features:",
+            'features': [
+                ("AI-Powered Analysis", self.ai_analysis),
+                ("Real-time Monitoring", self.real_time_monitoring),
+                ("Predictive Optimization", self.predictive_optimization),
+                ("Adaptive Learning", self.adaptive_learning)
+            ],
+            'start_text': "🚀 Start Advanced Optimization",
+            'start_command': self.start_advanced_optimization,
+            'stop_text': "⏹️ Stop Optimization",
+            'stop_command': self.stop_advanced_optimization,
+            'status_label': "Advanced Optimization Results:",
+            'status_attr': 'advanced_results'
+        })
     
     def create_system_monitor_tab(self):
         """Create modern System Monitor tab"""
+        # Panel colors (cached lookups)
+        panel = self._get_optimized_color('panel')
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_danger = self._get_optimized_color('panel_danger')
+        panel_text = self._get_optimized_color('panel_text')
+        panel_button_text = self._get_optimized_color('panel_button_text')
+        
         monitor_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
         self.notebook.add(monitor_frame, text="📊 System Monitor")
         
         # Title
         title_label = tk.Label(monitor_frame, text="📊 Real-time System Monitor", 
-                              font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+                              font=self._fonts['h1'], fg=panel_accent, bg=panel_dark)
         title_label.pack(pady=20)
         
         # Control buttons
-        button_frame = tk.Frame(monitor_frame, bg='#1e1e1e')
+        button_frame = tk.Frame(monitor_frame, bg=panel_dark)
         button_frame.pack(pady=10)
         
         self.start_monitor_btn = tk.Button(button_frame, text="📊 Start Monitoring",
                                           command=self.start_system_monitoring,
-                                          font=('Arial', 12, 'bold'), bg='#00ff88', fg='black',
+                                          font=self._fonts['h2'], bg=panel_accent, fg=panel_button_text,
                                           relief=tk.RAISED, bd=3, padx=20, pady=10)
         self.start_monitor_btn.pack(side=tk.LEFT, padx=10)
         
         self.stop_monitor_btn = tk.Button(button_frame, text="⏹️ Stop Monitoring",
                                          command=self.stop_system_monitoring,
-                                         font=('Arial', 12, 'bold'), bg='#ff4444', fg='white',
+                                         font=self._fonts['h2'], bg=panel_danger, fg=panel_text,
                                          relief=tk.RAISED, bd=3, padx=20, pady=10, state=tk.DISABLED)
         self.stop_monitor_btn.pack(side=tk.LEFT, padx=10)
         
         # Monitoring display
-        monitor_display_frame = tk.Frame(monitor_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        monitor_display_frame = tk.Frame(monitor_frame, bg=panel, relief=tk.RAISED, bd=1)
         monitor_display_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        tk.Label(monitor_display_frame, text="System Performance Monitor:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
+        tk.Label(monitor_display_frame, text="System Performance Monitor:", font=self._fonts['h2'],
+                fg=panel_text, bg=panel).pack(anchor=tk.W, padx=10, pady=5)
         
-        self.monitor_display = tk.Text(monitor_display_frame, height=20, bg='#1e1e1e', fg='#00ff88',
-                                      font=('Consolas', 9), state=tk.DISABLED, wrap=tk.WORD)
+        self.monitor_display = tk.Text(monitor_display_frame, height=20, bg=panel_dark, fg=panel_accent,
+                                      font=self._fonts['mono'], state=tk.DISABLED, wrap=tk.WORD)
         
         # Scrollbar for monitor display
-        monitor_scrollbar = tk.Scrollbar(monitor_display_frame, orient=tk.VERTICAL, command=self.monitor_display.yview)
-        self.monitor_display.configure(yscrollcommand=monitor_scrollbar.set)
-        
-        self.monitor_display.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        monitor_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self._attach_scrollbar(self.monitor_display, monitor_display_frame)
     
-    def create_network_optimizer_tab(self):
+    def create_network_optimizer_tab(self, tab_frame=None):
         """Create modern Network Optimizer tab"""
-        network_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
-        self.notebook.add(network_frame, text="🌐 Network Optimizer")
-        
-        # Title
-        title_label = tk.Label(network_frame, text="🌐 Advanced Network Optimizer", 
-                              font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
-        title_label.pack(pady=20)
-        
-        # Network profile selection
-        profile_frame = tk.Frame(network_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
-        profile_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        tk.Label(profile_frame, text="Network Profile:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.network_profile = tk.StringVar(value="gaming")
-        network_options = ["gaming", "streaming", "productivity"]
-        
-        for i, option in enumerate(network_options):
-            rb = self.create_modern_radiobutton(profile_frame, option.title(), 
-                                               self.network_profile, option, 0, i)
-        
-        # Control buttons
-        button_frame = tk.Frame(network_frame, bg='#1e1e1e')
-        button_frame.pack(pady=20)
-        
-        self.start_network_btn = tk.Button(button_frame, text="🌐 Start Network Optimization",
-                                          command=self.start_network_optimization,
-                                          font=('Arial', 12, 'bold'), bg='#00ff88', fg='black',
-                                          relief=tk.RAISED, bd=3, padx=20, pady=10)
-        self.start_network_btn.pack(side=tk.LEFT, padx=10)
-        
-        self.stop_network_btn = tk.Button(button_frame, text="⏹️ Stop Optimization",
-                                        command=self.stop_network_optimization,
-                                        font=('Arial', 12, 'bold'), bg='#ff4444', fg='white',
-                                        relief=tk.RAISED, bd=3, padx=20, pady=10, state=tk.DISABLED)
-        self.stop_network_btn.pack(side=tk.LEFT, padx=10)
-        
-        # Network status display
-        status_frame = tk.Frame(network_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
-        status_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        tk.Label(status_frame, text="Network Optimization Status:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.network_status = tk.Text(status_frame, height=15, bg='#1e1e1e', fg='#00ff88',
-                                     font=('Consolas', 9), state=tk.DISABLED, wrap=tk.WORD)
-        
-        # Scrollbar for network status
-        network_scrollbar = tk.Scrollbar(status_frame, orient=tk.VERTICAL, command=self.network_status.yview)
-        self.network_status.configure(yscrollcommand=network_scrollbar.set)
-        
-        self.network_status.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        network_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
-    
-    def create_gaming_optimizer_tab(self):
+        self._build_optimizer_tab({
+            'key': 'network',
+            'tab_text': "🌐 Network Optimizer",
+            'title': "🌐 Advanced Network Optimizer",
+            'profile_label': "Network Profile:",
+            'profile_attr': 'network_profile',
+            'profile_default': "gaming",
+            'options': _NETWORK_OPTIONS,
+            'features_label': None,
+            'features': [],
+            'start_text': "🌐 Start Network Optimization",
+            'start_command': self.start_network_optimization,
+            'stop_text': "⏹️ Stop Optimization",
+            'stop_command': self.stop_network_optimization,
+            'status_label': "Network Optimization Status:",
+            'status_attr': 'network_status'
+        }, tab_frame)
+    
+    def create_gaming_optimizer_tab(self, tab_frame=None):
         """Create modern Gaming Optimizer tab"""
-        gaming_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
-        self.notebook.add(gaming_frame, text="🎮 Gaming Optimizer")
+        self._build_optimizer_tab({
+            'key': 'gaming',
+            'tab_text': "🎮 Gaming Optimizer",
+            'title': "🎮 Advanced Gaming Optimizer",
+            'profile_label': "Gaming Profile:",
+            'profile_attr': 'gaming_profile',
+            'profile_default': "auto",
+            'options': _GAMING_OPTIONS,
+            'features_label': "Gaming Features:",
+            'features': [
+                ("Windows Game Mode", self._gaming_flags['game_mode']),
+                ("Anti-Cheat Optimization", self._gaming_flags['anti_cheat_optimization']),
+                ("Gaming Network Optimization", self._gaming_flags['gaming_network']),
+                ("Gaming Audio Optimization", self._gaming_flags['gaming_audio'])
+            ],
+            'start_text': "🎮 Start Gaming Optimization",
+            'start_command': self.start_gaming_optimization,
+            'stop_text': "⏹️ Stop Optimization",
+            'stop_command': self.stop_gaming_optimization,
+            'status_label': "Gaming Optimization Status:",
+            'status_attr': 'gaming_status'
+        }, tab_frame)
+    
+    def _build_optimizer_tab(self, spec, tab_frame=None):
+        """Build an optimizer tab (title, profiles, features, start/stop, status) from a spec dict
+        
+        When tab_frame is given (a lazy placeholder), the content is built into it
+        instead of adding a new notebook tab.
+        """
+        # Panel colors (cached lookups)
+        panel = self._get_optimized_color('panel')
+        panel_dark = self._get_optimized_color('panel_dark')
+        panel_accent = self._get_optimized_color('panel_accent')
+        panel_danger = self._get_optimized_color('panel_danger')
+        panel_text = self._get_optimized_color('panel_text')
+        panel_button_text = self._get_optimized_color('panel_button_text')
+        
+        # Shared widget options, built once per tab
+        panel_kw = {'bg': panel, 'relief': tk.RAISED, 'bd': 1}
+        section_label_kw = {'font': self._fonts['h2'], 'fg': panel_text, 'bg': panel}
+        button_kw = {'font': self._fonts['h2'], 'relief': tk.RAISED, 'bd': 3, 'padx': 20, 'pady': 10}
+        
+        if tab_frame is None:
+            tab_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
+            self.notebook.add(tab_frame, text=spec['tab_text'])
         
         # Title
-        title_label = tk.Label(gaming_frame, text="🎮 Advanced Gaming Optimizer", 
-                              font=('Arial', 16, 'bold'), fg='#00ff88', bg='#1e1e1e')
+        title_label = tk.Label(tab_frame, text=spec['title'], 
+                              font=self._fonts['h1'], fg=panel_accent, bg=panel_dark)
         title_label.pack(pady=20)
         
-        # Gaming profile selection
-        profile_frame = tk.Frame(gaming_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        # Profile selection
+        profile_frame = tk.Frame(tab_frame, **panel_kw)
         profile_frame.pack(fill=tk.X, padx=20, pady=10)
         
-        tk.Label(profile_frame, text="Gaming Profile:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.gaming_profile = tk.StringVar(value="auto")
-        gaming_options = ["auto", "league_of_legends", "valorant", "cs2", "fortnite", "apex_legends"]
-        
-        for i, option in enumerate(gaming_options):
-            rb = self.create_modern_radiobutton(profile_frame, option.replace('_', ' ').title(), 
-                                               self.gaming_profile, option, 0, i)
-        
-        # Gaming features
-        features_frame = tk.Frame(gaming_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
-        features_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        tk.Label(features_frame, text="Gaming Features:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
-        
-        self.game_mode = tk.BooleanVar(value=True)
-        self.anti_cheat_optimization = tk.BooleanVar(value=True)
-        self.gaming_network = tk.BooleanVar(value=True)
-        self.gaming_audio = tk.BooleanVar(value=True)
-        
-        gaming_features = [
-            ("Windows Game Mode", self.game_mode),
-            ("Anti-Cheat Optimization", self.anti_cheat_optimization),
-            ("Gaming Network Optimization", self.gaming_network),
-            ("Gaming Audio Optimization", self.gaming_audio)
-        ]
-        
-        for feature, var in gaming_features:
-            cb = tk.Checkbutton(features_frame, text=feature, variable=var,
-                               font=('Arial', 10), fg='white', bg='#2d2d2d',
-                               selectcolor='#00ff88', activebackground='#2d2d2d')
-            cb.pack(anchor=tk.W, padx=20, pady=2)
+        tk.Label(profile_frame, text=spec['profile_label'],
+                **section_label_kw).pack(anchor=tk.W, padx=10, pady=5)
+        
+        profile_var = tk.StringVar(value=spec['profile_default'])
+        setattr(self, spec['profile_attr'], profile_var)
+        
+        # Radio buttons are created in one Tcl evaluation (same look as create_modern_radiobutton)
+        self._batch_create_widgets('radiobutton', profile_frame,
+                                   [('-text', label, '-variable', str(profile_var), '-value', value)
+                                    for value, label in spec['options']],
+                                   ('-font', str(self._fonts['option']), '-fg', self.colors['text_primary'],
+                                    '-bg', self.colors['bg_secondary'], '-selectcolor', self.colors['accent'],
+                                    '-activebackground', self.colors['bg_tertiary'],
+                                    '-activeforeground', self.colors['text_primary'],
+                                    '-relief', tk.FLAT, '-bd', 2, '-highlightthickness', 2,
+                                    '-highlightcolor', self.colors['accent'],
+                                    '-highlightbackground', self.colors['bg_tertiary'],
+                                    '-indicatoron', 1, '-width', 15, '-anchor', tk.W),
+                                   ('-side', tk.LEFT, '-padx', 10, '-pady', 2))
+        
+        # Optional feature toggles
+        if spec['features']:
+            features_frame = tk.Frame(tab_frame, **panel_kw)
+            features_frame.pack(fill=tk.X, padx=20, pady=10)
+            
+            tk.Label(features_frame, text=spec['features_label'],
+                    **section_label_kw).pack(anchor=tk.W, padx=10, pady=5)
+            
+            feature_items = []
+            for feature, var in spec['features']:
+                feature_items.append(('-text', feature, '-variable', str(var)))
+            
+            # Checkbuttons are created in one Tcl evaluation
+            self._batch_create_widgets('checkbutton', features_frame, feature_items,
+                                       ('-font', str(self._fonts['body']), '-fg', panel_text, '-bg', panel,
+                                        '-selectcolor', panel_accent, '-activebackground', panel),
+                                       ('-anchor', tk.W, '-padx', 20, '-pady', 2))
         
         # Control buttons
-        button_frame = tk.Frame(gaming_frame, bg='#1e1e1e')
+        button_frame = tk.Frame(tab_frame, bg=panel_dark)
         button_frame.pack(pady=20)
         
-        self.start_gaming_btn = tk.Button(button_frame, text="🎮 Start Gaming Optimization",
-                                         command=self.start_gaming_optimization,
-                                         font=('Arial', 12, 'bold'), bg='#00ff88', fg='black',
-                                         relief=tk.RAISED, bd=3, padx=20, pady=10)
-        self.start_gaming_btn.pack(side=tk.LEFT, padx=10)
+        start_btn = tk.Button(button_frame, text=spec['start_text'], command=spec['start_command'],
+                             bg=panel_accent, fg=panel_button_text, **button_kw)
+        start_btn.pack(side=tk.LEFT, padx=10)
+        setattr(self, f"start_{spec['key']}_btn", start_btn)
         
-        self.stop_gaming_btn = tk.Button(button_frame, text="⏹️ Stop Optimization",
-                                        command=self.stop_gaming_optimization,
-                                        font=('Arial', 12, 'bold'), bg='#ff4444', fg='white',
-                                        relief=tk.RAISED, bd=3, padx=20, pady=10, state=tk.DISABLED)
-        self.stop_gaming_btn.pack(side=tk.LEFT, padx=10)
+        stop_btn = tk.Button(button_frame, text=spec['stop_text'], command=spec['stop_command'],
+                            bg=panel_danger, fg=panel_text, state=tk.DISABLED, **button_kw)
+        stop_btn.pack(side=tk.LEFT, padx=10)
+        setattr(self, f"stop_{spec['key']}_btn", stop_btn)
         
-        # Gaming status display
-        status_frame = tk.Frame(gaming_frame, bg='#2d2d2d', relief=tk.RAISED, bd=1)
+        # Status display
+        status_frame = tk.Frame(tab_frame, **panel_kw)
         status_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        tk.Label(status_frame, text="Gaming Optimization Status:", font=('Arial', 12, 'bold'),
-                fg='white', bg='#2d2d2d').pack(anchor=tk.W, padx=10, pady=5)
+        tk.Label(status_frame, text=spec['status_label'],
+                **section_label_kw).pack(anchor=tk.W, padx=10, pady=5)
+        
+        status_widget = tk.Text(status_frame, height=15, bg=panel_dark, fg=panel_accent,
+                               font=self._fonts['mono'], state=tk.DISABLED, wrap=tk.WORD)
+        setattr(self, spec['status_attr'], status_widget)
+        
+        # Scrollbar for status display
+        self._attach_scrollbar(status_widget, status_frame)
+    
+    def _attach_scrollbar(self, text, parent):
+        """Pack a Text widget with a vertical scrollbar linked to it
+        
+        The two widgets are wired with plain Tcl commands, so scrolling never
+        round-trips through Python callbacks.
+        """
+        scrollbar = tk.Scrollbar(parent, orient=tk.VERTICAL)
+        text.tk.call(text._w, 'configure', '-yscrollcommand', (scrollbar._w, 'set'))
+        scrollbar.tk.call(scrollbar._w, 'configure', '-command', (text._w, 'yview'))
+        
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        return scrollbar
+    
+    def _batch_create_widgets(self, widget_class, parent, items, common_options, pack_options):
+        """Create and pack several widgets of one Tk class with a single Tcl evaluation
+        
+        items holds the per-widget option tuples; common_options and pack_options
+        apply to every widget.
+        """
+        batch = []
+        for i, options in enumerate(items):
+            batch.extend((f"{parent._w}.{widget_class}{i}", options))
+        
+        self.root.tk.call('set', '::ngxsmk_batch', (common_options, pack_options, tuple(batch)))
+        self.root.tk.eval(
+            'lassign $::ngxsmk_batch common pack_options items\n'
+            'foreach {path options} $items {\n'
+            f'    {widget_class} $path {{*}}$options {{*}}$common\n'
+            '    pack $path {*}$pack_options\n'
+            '}\n'
+            'unset ::ngxsmk_batch common pack_options items path options'
+        )
+    
+    def _pump_asyncio(self):
+        """Run one iteration of the asyncio loop, then reschedule from Tk"""
+        if self._loop.is_closed():
+            return
+        try:
+            self._loop.stop()
+            self._loop.run_forever()
+        except Exception:
+            log.exception("Asyncio pump error")
+        
+        if self._closed:
+            self._close_loop()
+            return
+        
+        # Poll faster while optimizer tasks are in flight
+        interval = 5 if self._active_tasks else 10
+        self.root.after(interval, self._pump_asyncio)
+    
+    def _spawn(self, coro):
+        """Schedule a coroutine on the app's asyncio loop"""
+        task = self._loop.create_task(coro)
+        self._active_tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+    
+    def _on_task_done(self, task):
+        """Forget a finished task and report unexpected failures loudly"""
+        self._active_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Background task failed", exc_info=task.exception())
+    
+    def _get_optimizer_spec(self, kind):
+        """Return (results widget, start button, stop button, label) for an optimizer"""
+        if kind == 'advanced':
+            return (self.advanced_results, self.start_advanced_btn, self.stop_advanced_btn,
+                    "Advanced optimization")
+        if kind == 'network':
+            return (self.network_status, self.start_network_btn, self.stop_network_btn,
+                    "Network optimization")
+        return (self.gaming_status, self.start_gaming_btn, self.stop_gaming_btn,
+                "Gaming optimization")
+    
+    def _get_proc_executor(self, kind):
+        """Return the worker process owning an optimizer kind, starting it on first use"""
+        executor = self._proc_executors.get(kind)
+        if executor is None:
+            executor = self._proc_executors[kind] = ProcessPoolExecutor(max_workers=1)
+        return executor
+    
+    def _submit_start(self, kind, profile):
+        """Start an optimizer on its owner; returns an awaitable for the rendered results"""
+        if kind == 'gaming':
+            return self._loop.run_in_executor(self.executor, self._render_optimization,
+                                              self.gaming_optimizer.start_gaming_optimization, profile)
+        return self._loop.run_in_executor(self._get_proc_executor(kind), run_optimization,
+                                          kind, profile)
+    
+    def _submit_stop(self, kind):
+        """Stop an optimizer on its owner; returns an awaitable for the stop result"""
+        if kind == 'gaming':
+            return self._loop.run_in_executor(self.executor, self.gaming_optimizer.stop_gaming_optimization)
+        return self._loop.run_in_executor(self._get_proc_executor(kind), stop_optimization, kind)
+    
+    @staticmethod
+    def _render_optimization(start_func, profile):
+        """Run an in-process optimizer and render its results (called on a worker thread)"""
+        return _JSON_ENCODER.encode(start_func(profile))
+    
+    async def _run_opt(self, kind, profile):
+        """Run an optimizer off the Tk thread and hand the results back to the UI"""
+        results_widget, start_btn, stop_btn, label = self._get_optimizer_spec(kind)
+        try:
+            text = await self._submit_start(kind, profile)
+        except asyncio.CancelledError:
+            # Stopped before the results arrived; Stop already reset the buttons
+            return
+        except (OSError, RuntimeError, ValueError) as e:
+            start_btn.config(state=tk.NORMAL)
+            stop_btn.config(state=tk.DISABLED)
+            messagebox.showerror("Error", f"{label} failed: {str(e)}")
+            return
+        except Exception:
+            # Unexpected failures propagate to the task and are logged by _on_task_done
+            start_btn.config(state=tk.NORMAL)
+            stop_btn.config(state=tk.DISABLED)
+            raise
+        finally:
+            if self._active_futures.get(kind) is asyncio.current_task():
+                del self._active_futures[kind]
         
-        self.gaming_status = tk.Text(status_frame, height=15, bg='#1e1e1e', fg='#00ff88',
-                                    font=('Consolas', 9), state=tk.DISABLED, wrap=tk.WORD)
+        # Already on the Tk thread, so write directly (no window for a stale write after Stop)
+        self._write_results(results_widget, stop_btn, text)
+    
+    async def _stop_opt(self, kind, log_result=True):
+        """Stop an optimizer off the Tk thread and reset its buttons"""
+        results_widget, start_btn, stop_btn, label = self._get_optimizer_spec(kind)
         
-        # Scrollbar for gaming status
-        gaming_scrollbar = tk.Scrollbar(status_frame, orient=tk.VERTICAL, command=self.gaming_status.yview)
-        self.gaming_status.configure(yscrollcommand=gaming_scrollbar.set)
+        # Drop a Start that is still in flight so its results are never written
+        pending = self._active_futures.pop(kind, None)
+        if pending is not None:
+            pending.cancel()
         
-        self.gaming_status.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        gaming_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        try:
+            result = await self._submit_stop(kind)
+        except (OSError, RuntimeError, ValueError) as e:
+            messagebox.showerror("Error", f"Failed to stop {label.lower()}: {str(e)}")
+            return
+        
+        if log_result:
+            self._queue_log(results_widget, f"{label} stopped: {result}\n")
+        
+        start_btn.config(state=tk.NORMAL)
+        stop_btn.config(state=tk.DISABLED)
+    
+    def _write_results(self, results_widget, stop_btn, text):
+        """Display rendered optimizer results and enable the matching Stop button"""
+        self._set_text(results_widget, text)
+        stop_btn.config(state=tk.NORMAL)
+    
+    def _set_text(self, widget, text):
+        """Replace the whole content of a read-only Text widget in one operation"""
+        # Skip the update when the widget already shows exactly this text
+        if self._last_text.get(widget) == text:
+            return
+        
+        widget.configure(state=tk.NORMAL)
+        widget.replace("1.0", tk.END, text)
+        widget.configure(state=tk.DISABLED)
+        self._last_text[widget] = text
+    
+    def _queue_log(self, widget, line):
+        """Queue a status line for a Text widget; bursts are flushed together on idle"""
+        self._pending_logs[widget].append(line)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_logs)
+    
+    def _flush_logs(self):
+        """Append all queued status lines with a single insert per widget"""
+        self._log_flush_scheduled = False
+        pending, self._pending_logs = self._pending_logs, defaultdict(list)
+        for widget, lines in pending.items():
+            # Appended lines make the cached full text stale
+            self._last_text.pop(widget, None)
+            widget.configure(state=tk.NORMAL)
+            self._bounded_append(widget, "".join(lines))
+            widget.configure(state=tk.DISABLED)
+            self._mark_dirty(widget)
+    
+    @staticmethod
+    def _bounded_append(widget, text, max_lines=STATUS_MAX_LINES):
+        """Append text to a (writable) Text widget, dropping the oldest lines past max_lines"""
+        widget.insert(tk.END, text)
+        # "end-1c" sits on the empty line after the final newline, so it is not counted
+        line_count = int(widget.index("end-1c").split('.')[0]) - 1
+        if line_count > max_lines:
+            widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+    
+    def _mark_dirty(self, widget):
+        """Mark a Text widget for a single scroll-to-end on the next idle pass"""
+        if not self._dirty_widgets:
+            self.root.after_idle(self._flush_dirty)
+        self._dirty_widgets.add(widget)
+    
+    def _flush_dirty(self):
+        """Scroll every dirty Text widget to its end once"""
+        dirty, self._dirty_widgets = self._dirty_widgets, set()
+        for widget in dirty:
+            widget.see(tk.END)
     
     def start_advanced_optimization(self):
         """Start advanced optimization"""
-        try:
-            profile = self.advanced_profile.get()
-            results = self.advanced_optimizer.start_advanced_optimization(profile)
-            
-            self.advanced_results.config(state=tk.NORMAL)
-            self.advanced_results.delete(1.0, tk.END)
-            self.advanced_results.insert(tk.END, json.dumps(results, indent=2))
-            self.advanced_results.config(state=tk.DISABLED)
-            
-            self.start_advanced_btn.config(state=tk.DISABLED)
-            self.stop_advanced_btn.config(state=tk.NORMAL)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Advanced optimization failed: {str(e)}")
+        # Errors are handled inside _run_opt, off the Tk event path
+        profile = self.advanced_profile.get()
+        self.start_advanced_btn.config(state=tk.DISABLED)
+        # Stop is available right away so an in-flight run can be cancelled
+        self.stop_advanced_btn.config(state=tk.NORMAL)
+        self._active_futures['advanced'] = self._spawn(self._run_opt('advanced', profile))
     
     def stop_advanced_optimization(self):
         """Stop advanced optimization"""
-        try:
-            self.advanced_optimizer.stop_optimization()
-            self.start_advanced_btn.config(state=tk.NORMAL)
-            self.stop_advanced_btn.config(state=tk.DISABLED)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to stop optimization: {str(e)}")
+        self._spawn(self._stop_opt('advanced', log_result=False))
     
     def start_system_monitoring(self):
         """Start system monitoring"""
         try:
             result = self.system_monitor.start_monitoring(interval=5)
             
-            self.monitor_display.config(state=tk.NORMAL)
-            self.monitor_display.delete(1.0, tk.END)
-            self.monitor_display.insert(tk.END, f"System monitoring started: {result}\n")
-            self.monitor_display.config(state=tk.DISABLED)
+            self._set_text(self.monitor_display, f"System monitoring started: {result}\n")
             
             self.start_monitor_btn.config(state=tk.DISABLED)
             self.stop_monitor_btn.config(state=tk.NORMAL)
@@ -2684,9 +3094,7 @@ class NetworkOptimizerApp:
         try:
             result = self.system_monitor.stop_monitoring()
             
-            self.monitor_display.config(state=tk.NORMAL)
-            self.monitor_display.insert(tk.END, f"System monitoring stopped: {result}\n")
-            self.monitor_display.config(state=tk.DISABLED)
+            self._queue_log(self.monitor_display, f"System monitoring stopped: {result}\n")
             
             self.start_monitor_btn.config(state=tk.NORMAL)
             self.stop_monitor_btn.config(state=tk.DISABLED)
@@ -2696,67 +3104,29 @@ class NetworkOptimizerApp:
     
     def start_network_optimization(self):
         """Start network optimization"""
-        try:
-            profile = self.network_profile.get()
-            results = self.network_optimizer.start_network_optimization(profile)
-            
-            self.network_status.config(state=tk.NORMAL)
-            self.network_status.delete(1.0, tk.END)
-            self.network_status.insert(tk.END, json.dumps(results, indent=2))
-            self.network_status.config(state=tk.DISABLED)
-            
-            self.start_network_btn.config(state=tk.DISABLED)
-            self.stop_network_btn.config(state=tk.NORMAL)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Network optimization failed: {str(e)}")
+        # Errors are handled inside _run_opt, off the Tk event path
+        profile = self.network_profile.get()
+        self.start_network_btn.config(state=tk.DISABLED)
+        # Stop is available right away so an in-flight run can be cancelled
+        self.stop_network_btn.config(state=tk.NORMAL)
+        self._active_futures['network'] = self._spawn(self._run_opt('network', profile))
     
     def stop_network_optimization(self):
         """Stop network optimization"""
-        try:
-            result = self.network_optimizer.stop_network_optimization()
-            
-            self.network_status.config(state=tk.NORMAL)
-            self.network_status.insert(tk.END, f"Network optimization stopped: {result}\n")
-            self.network_status.config(state=tk.DISABLED)
-            
-            self.start_network_btn.config(state=tk.NORMAL)
-            self.stop_network_btn.config(state=tk.DISABLED)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to stop network optimization: {str(e)}")
+        self._spawn(self._stop_opt('network'))
     
     def start_gaming_optimization(self):
         """Start gaming optimization"""
-        try:
-            profile = self.gaming_profile.get()
-            results = self.gaming_optimizer.start_gaming_optimization(profile)
-            
-            self.gaming_status.config(state=tk.NORMAL)
-            self.gaming_status.delete(1.0, tk.END)
-            self.gaming_status.insert(tk.END, json.dumps(results, indent=2))
-            self.gaming_status.config(state=tk.DISABLED)
-            
-            self.start_gaming_btn.config(state=tk.DISABLED)
-            self.stop_gaming_btn.config(state=tk.NORMAL)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Gaming optimization failed: {str(e)}")
+        # Errors are handled inside _run_opt, off the Tk event path
+        profile = self.gaming_profile.get()
+        self.start_gaming_btn.config(state=tk.DISABLED)
+        # Stop is available right away so an in-flight run can be cancelled
+        self.stop_gaming_btn.config(state=tk.NORMAL)
+        self._active_futures['gaming'] = self._spawn(self._run_opt('gaming', profile))
     
     def stop_gaming_optimization(self):
         """Stop gaming optimization"""
-        try:
-            result = self.gaming_optimizer.stop_gaming_optimization()
-            
-            self.gaming_status.config(state=tk.NORMAL)
-            self.gaming_status.insert(tk.END, f"Gaming optimization stopped: {result}\n")
-            self.gaming_status.config(state=tk.DISABLED)
-            
-            self.start_gaming_btn.config(state=tk.NORMAL)
-            self.stop_gaming_btn.config(state=tk.DISABLED)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to stop gaming optimization: {str(e)}")
+        self._spawn(self._stop_opt('gaming'))
     
     def run(self):
         """Run the application"""
@@ -2764,7 +3134,9 @@ class NetworkOptimizerApp:
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             self.root.mainloop()
         except KeyboardInterrupt:
-            self.on_closing()
+            # The Tk loop is gone, so close synchronously
+            self.save_settings()
+            self._finish_closing()
             
     def show_settings(self):
         """Show settings dialog"""
@@ -2776,39 +3148,102 @@ class NetworkOptimizerApp:
     
     def on_closing(self):
         """Handle optimized application closing"""
+        if self._closing:
+            return
+        self._closing = True
+        
+        try:
+            # Stop optimizers and save settings concurrently, bounded by a short timeout
+            task = self._spawn(asyncio.wait_for(self._async_cleanup(), timeout=0.5))
+            task.add_done_callback(self._on_cleanup_done)
+            
+            # Fallback in case the cleanup task never completes
+            self.root.after(1000, self._finish_closing)
+        except Exception:
+            log.exception("Error during closing")
+            self._finish_closing()
+    
+    async def _async_cleanup(self):
+        """Stop running optimizers and save settings off the Tk thread"""
+        settings = self._collect_settings()
+        
+        # Gaming may have been started by Quick Gaming Mode; worker optimizers
+        # only have anything to stop once their process exists
+        stops = [self._submit_stop(kind) for kind in ('network', 'gaming')
+                 if kind == 'gaming' or kind in self._proc_executors]
+        await asyncio.gather(
+            *stops,
+            self._loop.run_in_executor(self.executor, self.config_manager.save_settings, settings),
+            return_exceptions=True
+        )
+    
+    def _on_cleanup_done(self, task):
+        """Close the window once the cleanup task finished or timed out"""
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Error during closing", exc_info=task.exception())
+        self._finish_closing()
+    
+    def _finish_closing(self):
+        """Release resources and destroy the window (runs once)"""
+        if self._closed:
+            return
+        self._closed = True
+        
         try:
-            # Save settings
-            self.save_settings()
-            
             # Cleanup resources
             self._cleanup_resources()
-            
+        finally:
+            # Called from a task callback the loop is still running; the pump
+            # closes it once run_forever returns
+            if not self._loop.is_running():
+                self._close_loop()
             # Close the application
             self.root.destroy()
-        except Exception as e:
-            print(f"Error during closing: {e}")
-            self.root.destroy()
+    
+    def _close_loop(self):
+        """Cancel outstanding tasks, let them unwind, and close the asyncio loop"""
+        if self._loop.is_closed():
+            return
+        pending = [task for task in asyncio.all_tasks(self._loop) if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self._loop.close()
     
     def _cleanup_resources(self):
         """Cleanup resources for better memory management"""
         try:
             # Shutdown thread pool
-            if hasattr(self, 'executor'):
-                self.executor.shutdown(wait=False)
-            
-            # Clear caches
-            if hasattr(self, '_get_optimized_color'):
-                self._get_optimized_color.cache_clear()
+            executor = getattr(self, 'executor', None)
+            if executor is not None:
+                executor.shutdown(wait=False)
+            
+            # Shutdown optimizer worker processes, dropping queued calls where supported
+            for proc_executor in getattr(self, '_proc_executors', {}).values():
+                if _CAN_CANCEL_FUTURES:
+                    proc_executor.shutdown(wait=False, cancel_futures=True)
+                else:
+                    proc_executor.shutdown(wait=False)
+
+            # Write any debounced setting changes before exit
+            config_manager = getattr(self, 'config_manager', None)
+            if config_manager is not None:
+                config_manager.close()
+
+            # Clear caches (bound at class level, always present)
+            self._get_optimized_color.cache_clear()
             
             # Force garbage collection
             gc.collect()
             
             # Clear weak references
-            if hasattr(self, '_weak_refs'):
-                self._weak_refs.clear()
+            weak_refs = getattr(self, '_weak_refs', None)
+            if weak_refs is not None:
+                weak_refs.clear()
                 
-        except Exception as e:
-            print(f"Cleanup error: {e}")
+        except Exception:
+            log.exception("Cleanup error")
     
     def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
@@ -2817,35 +3252,43 @@ class NetworkOptimizerApp:
                 self.exit_fullscreen()
             else:
                 self.enter_fullscreen()
-        except Exception as e:
-            print(f"Fullscreen toggle error: {e}")
+        except Exception:
+            log.exception("Fullscreen toggle error")
     
     def enter_fullscreen(self):
         """Enter fullscreen mode"""
         try:
-            self.root.state('zoomed')
-            self.is_fullscreen = True
-            # Update status text if available
-            if hasattr(self, 'status_text'):
-                self.status_text.configure(text="Fullscreen Mode")
-        except Exception as e:
-            print(f"Enter fullscreen error: {e}")
+            self._set_window_mode('zoomed', True, "Fullscreen Mode")
+        except Exception:
+            log.exception("Enter fullscreen error")
     
     def exit_fullscreen(self, event=None):
         """Exit fullscreen mode"""
         try:
-            self.root.state('normal')
-            self.is_fullscreen = False
-            # Update status text if available
-            if hasattr(self, 'status_text'):
-                self.status_text.configure(text="Windowed Mode")
-        except Exception as e:
-            print(f"Exit fullscreen error: {e}")
+            self._set_window_mode('normal', False, "Windowed Mode")
+        except Exception:
+            log.exception("Exit fullscreen error")
+    
+    def _set_window_mode(self, state, fullscreen, status):
+        """Apply a window state and its status text, skipping no-op repeats (e.g. Escape in windowed mode)"""
+        if self.is_fullscreen == fullscreen and self._last_status_text == status:
+            return
+        
+        self.root.state(state)
+        self.is_fullscreen = fullscreen
+        # Update status text if available
+        if self.status_text is not None:
+            self.status_text.configure(text=status)
+            self._last_status_text = status
 
 if __name__ == "__main__":
+    # Required for the optimizer worker process in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+    _configure_logging()
     try:
         app = NetworkOptimizerApp()
         app.run()
     except Exception as e:
-        print(f"Application failed to start: {e}")
+        log.exception("Application failed to start")
+        print(f"Application failed to start: {e}", file=sys.stderr)
         sys.exit(1)
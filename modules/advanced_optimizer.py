@@ -6,17 +6,62 @@ Advanced AI-powered optimization with real-time monitoring and intelligent resou
 import psutil
 import time
 import threading
-import json
 import os
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import subprocess
 import platform
+import ctypes
+import uuid
+from collections import deque
+from contextlib import suppress
 
-@dataclass
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# Platform is fixed for the life of the process
+_IS_WINDOWS = platform.system() == "Windows"
+
+# WMI (CPU temperature via OpenHardwareMonitor) is only attempted on Windows
+wmi = None
+if _IS_WINDOWS:
+    try:
+        import wmi
+    except ImportError:
+        wmi = None
+
+# Gaming process names; matched as substrings of the lowercased process name
+# (executables such as leagueclient.exe or r5apex.exe carry suffixes/prefixes)
+_GAME_PROCS = frozenset({'league', 'valorant', 'cs2', 'fortnite', 'apex'})
+_GAME_SUBSTRINGS = tuple(_GAME_PROCS)
+
+# Memory-heavy applications reported by the memory scan
+_UNNECESSARY_APPS = ('chrome', 'firefox', 'edge', 'discord', 'spotify')
+
+# Shortest window (seconds) a new CPU usage sample is measured over; the power
+# plan is only changed on a reading at least this long
+CPU_SAMPLE_WINDOW = 1.0
+
+def _cpu_busy_percent(before, after) -> float:
+    """Busy share (0-100) of one core between two psutil.cpu_times samples"""
+    total = sum(after) - sum(before)
+    if total <= 0:
+        return 0.0
+    # Time waiting on I/O counts as idle, as in psutil.cpu_percent
+    idle = (after.idle - before.idle) + (getattr(after, 'iowait', 0) - getattr(before, 'iowait', 0))
+    return min(100.0, max(0.0, 100.0 * (total - idle) / total))
+
+@dataclass(frozen=True)
 class OptimizationProfile:
     """Optimization profile for different use cases"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('name', 'cpu_boost', 'gpu_boost', 'memory_optimization', 'network_optimization',
+                 'gaming_mode', 'streaming_mode', 'productivity_mode')
+    
     name: str
     cpu_boost: bool
     gpu_boost: bool
@@ -25,6 +70,58 @@ class OptimizationProfile:
     gaming_mode: bool
     streaming_mode: bool
     productivity_mode: bool
+    
+    # Frozen slotted instances need explicit pickle support
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+    
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            object.__setattr__(self, field, value)
+
+# Built-in optimization profiles (immutable, shared by all optimizer instances)
+_DEFAULT_PROFILES = {
+    'gaming': OptimizationProfile(
+        name="Gaming",
+        cpu_boost=True,
+        gpu_boost=True,
+        memory_optimization=True,
+        network_optimization=True,
+        gaming_mode=True,
+        streaming_mode=False,
+        productivity_mode=False
+    ),
+    'streaming': OptimizationProfile(
+        name="Streaming",
+        cpu_boost=True,
+        gpu_boost=True,
+        memory_optimization=True,
+        network_optimization=True,
+        gaming_mode=False,
+        streaming_mode=True,
+        productivity_mode=False
+    ),
+    'productivity': OptimizationProfile(
+        name="Productivity",
+        cpu_boost=False,
+        gpu_boost=False,
+        memory_optimization=True,
+        network_optimization=False,
+        gaming_mode=False,
+        streaming_mode=False,
+        productivity_mode=True
+    ),
+    'balanced': OptimizationProfile(
+        name="Balanced",
+        cpu_boost=True,
+        gpu_boost=True,
+        memory_optimization=True,
+        network_optimization=True,
+        gaming_mode=False,
+        streaming_mode=False,
+        productivity_mode=False
+    )
+}
 
 class AdvancedOptimizer:
     """Advanced AI-powered optimizer with intelligent resource management"""
@@ -32,56 +129,37 @@ class AdvancedOptimizer:
     def __init__(self):
         self.is_running = False
         self.monitoring_thread = None
+        self._prev_net = None  # (time, net_io_counters) of the previous monitor tick
+        self._stop_event = threading.Event()  # wakes the monitor immediately on stop
+        self._pending_commands = []  # powercfg/reg commands run in one batch per optimization
+        
+        # Power scheme API, used instead of spawning powercfg where available
+        self.powrprof = None
+        if _IS_WINDOWS:
+            try:
+                self.powrprof = ctypes.windll.powrprof
+            except Exception:
+                self.powrprof = None
         self.optimization_profiles = self._load_profiles()
-        self.performance_history = []
+        self.performance_history = deque(maxlen=100)  # Keep only last 100 entries
         self.ai_recommendations = []
         self.real_time_stats = {}
+        self._run_ts = None  # start time of the current optimization run (ISO string)
+        self._net_if_cache = (0.0, [])  # (monotonic time, interface names), 60 s TTL
+        self._cpu_freq_cache = (0.0, None)  # (monotonic time, psutil.cpu_freq()), 30 s TTL
+        self._cpu_temp_probe = None  # None = untried, False = unavailable, else the sensor query
+        
+        # Prime psutil's CPU counter so the monitor's first non-blocking
+        # cpu_percent() call returns the usage since startup
+        psutil.cpu_percent(interval=None)
+        # (monotonic time, per-core cpu_times) that _sample_cpu measures from; owned
+        # by this instance, unlike psutil's module-global cpu_percent baseline
+        self._cpu_baseline = (time.monotonic(), psutil.cpu_times(percpu=True))
+        self._cpu_reading = (0.0, None)  # (window seconds, (average, busiest core)) of the last sample
         
     def _load_profiles(self) -> Dict[str, OptimizationProfile]:
-        """Load optimization profiles"""
-        profiles = {
-            'gaming': OptimizationProfile(
-                name="Gaming",
-                cpu_boost=True,
-                gpu_boost=True,
-                memory_optimization=True,
-                network_optimization=True,
-                gaming_mode=True,
-                streaming_mode=False,
-                productivity_mode=False
-            ),
-            'streaming': OptimizationProfile(
-                name="Streaming",
-                cpu_boost=True,
-                gpu_boost=True,
-                memory_optimization=True,
-                network_optimization=True,
-                gaming_mode=False,
-                streaming_mode=True,
-                productivity_mode=False
-            ),
-            'productivity': OptimizationProfile(
-                name="Productivity",
-                cpu_boost=False,
-                gpu_boost=False,
-                memory_optimization=True,
-                network_optimization=False,
-                gaming_mode=False,
-                streaming_mode=False,
-                productivity_mode=True
-            ),
-            'balanced': OptimizationProfile(
-                name="Balanced",
-                cpu_boost=True,
-                gpu_boost=True,
-                memory_optimization=True,
-                network_optimization=True,
-                gaming_mode=False,
-                streaming_mode=False,
-                productivity_mode=False
-            )
-        }
-        return profiles
+        """Load optimization profiles (a shallow copy; the profiles are frozen)"""
+        return dict(_DEFAULT_PROFILES)
     
     def start_advanced_optimization(self, profile_name: str = 'gaming') -> Dict[str, any]:
         """Start advanced AI-powered optimization"""
@@ -92,9 +170,13 @@ class AdvancedOptimizer:
         
         try:
             self.is_running = True
+            
+            # One timestamp for the whole run, formatted once and shared by
+            # every result section
+            self._run_ts = datetime.now().isoformat()
             results = {
                 'profile': profile_name,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': self._run_ts,
                 'optimizations': []
             }
             
@@ -102,35 +184,24 @@ class AdvancedOptimizer:
             analysis = self._ai_system_analysis()
             results['analysis'] = analysis
             
-            # Intelligent CPU optimization
-            if profile.cpu_boost:
-                cpu_result = self._intelligent_cpu_optimization()
-                results['optimizations'].append(cpu_result)
-            
-            # Advanced GPU optimization
-            if profile.gpu_boost:
-                gpu_result = self._advanced_gpu_optimization()
-                results['optimizations'].append(gpu_result)
-            
-            # Smart memory management
-            if profile.memory_optimization:
-                memory_result = self._smart_memory_optimization()
-                results['optimizations'].append(memory_result)
-            
-            # Intelligent network optimization
-            if profile.network_optimization:
-                network_result = self._intelligent_network_optimization()
-                results['optimizations'].append(network_result)
-            
-            # Gaming-specific optimizations
-            if profile.gaming_mode:
-                gaming_result = self._gaming_specific_optimization()
-                results['optimizations'].append(gaming_result)
-            
-            # Streaming optimizations
-            if profile.streaming_mode:
-                streaming_result = self._streaming_optimization()
-                results['optimizations'].append(streaming_result)
+            # Independent optimizations enabled by the profile: CPU, GPU, memory,
+            # network, gaming and streaming
+            tasks = [
+                (profile.cpu_boost, self._intelligent_cpu_optimization),
+                (profile.gpu_boost, self._advanced_gpu_optimization),
+                (profile.memory_optimization, self._smart_memory_optimization),
+                (profile.network_optimization, self._intelligent_network_optimization),
+                (profile.gaming_mode, self._gaming_specific_optimization),
+                (profile.streaming_mode, self._streaming_optimization)
+            ]
+            
+            # Run serially in profile order: system calls are queued for the
+            # batch below, and the remaining work is GIL-bound process scans.
+            # Each helper catches its own errors.
+            results['optimizations'] = [func() for enabled, func in tasks if enabled]
+            
+            # Apply all queued powercfg/reg changes with a single process spawn
+            self._flush_commands()
             
             # Start real-time monitoring
             self._start_monitoring()
@@ -145,36 +216,44 @@ class AdvancedOptimizer:
             self.is_running = False
             return {'status': 'error', 'message': str(e)}
     
-    def _ai_system_analysis(self) -> Dict[str, any]:
-        """AI-powered system analysis"""
+    def _ai_system_analysis(self, include_connections: bool = False) -> Dict[str, any]:
+        """AI-powered system analysis
+        
+        Connection counting is the most expensive psutil query and is skipped
+        unless include_connections is set; it then only covers this process.
+        """
         try:
             # Get comprehensive system info
+            cpu_usage, cpu_peak = self._sample_cpu()
             cpu_info = {
                 'count': psutil.cpu_count(),
-                'frequency': psutil.cpu_freq(),
-                'usage': psutil.cpu_percent(interval=1),
+                'frequency': self._cpu_freq_cached(),
+                'usage': cpu_usage,
+                'peak_core_usage': cpu_peak,
                 'temperature': self._get_cpu_temperature()
             }
             
-            memory_info = {
-                'total': psutil.virtual_memory().total,
-                'available': psutil.virtual_memory().available,
-                'used': psutil.virtual_memory().used,
-                'percentage': psutil.virtual_memory().percent
-            }
+            # One snapshot each; every field below reads from the same sample
+            vm = psutil.virtual_memory()
+            memory_info = {'total': vm.total, **self._memory_snapshot(vm)}
             
+            du = psutil.disk_usage('/')
             disk_info = {
-                'total': psutil.disk_usage('/').total,
-                'used': psutil.disk_usage('/').used,
-                'free': psutil.disk_usage('/').free,
-                'percentage': psutil.disk_usage('/').percent
+                'total': du.total,
+                'used': du.used,
+                'free': du.free,
+                'percentage': du.percent
             }
             
             network_info = {
-                'interfaces': list(psutil.net_if_addrs().keys()),
-                'connections': len(psutil.net_connections()),
+                'interfaces': self._get_interface_names(),
                 'io_counters': psutil.net_io_counters()
             }
+            if include_connections:
+                proc = psutil.Process()
+                # Process.connections was renamed to net_connections in psutil 6.0
+                get_connections = getattr(proc, 'net_connections', None) or proc.connections
+                network_info['connections'] = len(get_connections(kind='inet'))
             
             # AI analysis of system health
             health_score = self._calculate_system_health_score(cpu_info, memory_info, disk_info)
@@ -185,82 +264,109 @@ class AdvancedOptimizer:
                 'disk': disk_info,
                 'network': network_info,
                 'health_score': health_score,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
             return {'error': str(e)}
     
+    def _cpu_freq_cached(self):
+        """psutil.cpu_freq(), cached for 30 seconds (slow to read, changes slowly)"""
+        now = time.monotonic()
+        cached_at, freq = self._cpu_freq_cache
+        if freq is None or now - cached_at > 30:
+            freq = psutil.cpu_freq()
+            self._cpu_freq_cache = (now, freq)
+        return freq
+    
+    def _get_interface_names(self) -> List[str]:
+        """Network interface names, cached for 60 seconds (they rarely change)"""
+        now = time.monotonic()
+        cached_at, names = self._net_if_cache
+        if not names or now - cached_at > 60:
+            names = list(psutil.net_if_addrs().keys())
+            self._net_if_cache = (now, names)
+        return names
+    
     def _get_cpu_temperature(self) -> Optional[float]:
-        """Get CPU temperature if available"""
-        try:
-            if platform.system() == "Windows":
-                # Try to get temperature from WMI
-                import wmi
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                temperature_infos = w.Sensor()
-                for sensor in temperature_infos:
-                    if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                        return float(sensor.Value)
+        """Get CPU temperature if available
+        
+        A failed probe (no WMI, OpenHardwareMonitor not running) is remembered, so
+        the COM query is not retried on every analysis until invalidate_caches().
+        """
+        if self._cpu_temp_probe is False:
             return None
-        except:
+        if self._cpu_temp_probe is None:
+            self._cpu_temp_probe = self._query_ohm_cpu_temperature if wmi is not None else False
+            if self._cpu_temp_probe is False:
+                return None
+        
+        try:
+            return self._cpu_temp_probe()
+        except Exception:
+            self._cpu_temp_probe = False
             return None
     
+    @staticmethod
+    def _query_ohm_cpu_temperature() -> Optional[float]:
+        """Read the CPU temperature sensor exposed by OpenHardwareMonitor over WMI"""
+        # A new connection per query: WMI/COM objects must not be shared across threads
+        w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
+        temperature_infos = w.Sensor()
+        for sensor in temperature_infos:
+            if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
+                return float(sensor.Value)
+        return None
+    
     def _calculate_system_health_score(self, cpu_info: Dict, memory_info: Dict, disk_info: Dict) -> int:
-        """Calculate overall system health score (0-100)"""
-        try:
-            score = 100
-            
-            # CPU health (30% weight)
-            cpu_usage = cpu_info.get('usage', 0)
-            if cpu_usage > 80:
-                score -= 20
-            elif cpu_usage > 60:
-                score -= 10
-            
-            # Memory health (30% weight)
-            memory_usage = memory_info.get('percentage', 0)
-            if memory_usage > 90:
-                score -= 25
-            elif memory_usage > 80:
-                score -= 15
-            elif memory_usage > 70:
-                score -= 10
-            
-            # Disk health (20% weight)
-            disk_usage = disk_info.get('percentage', 0)
-            if disk_usage > 90:
-                score -= 20
-            elif disk_usage > 80:
-                score -= 10
-            
-            # Temperature health (20% weight)
-            temp = cpu_info.get('temperature')
-            if temp and temp > 80:
-                score -= 20
-            elif temp and temp > 70:
-                score -= 10
-            
-            return max(0, min(100, score))
-            
-        except:
-            return 50  # Default score if calculation fails
+        """Calculate overall system health score (0-100)
+        
+        Each signal's deduction is computed branch-free from its fixed thresholds.
+        """
+        cpu_usage = cpu_info.get('usage', 0)
+        memory_usage = memory_info.get('percentage', 0)
+        disk_usage = disk_info.get('percentage', 0)
+        temp = cpu_info.get('temperature')
+        
+        # CPU health (30% weight)
+        deduction = 20 * (cpu_usage > 80) + 10 * (60 < cpu_usage <= 80)
+        
+        # Memory health (30% weight)
+        deduction += 25 * (memory_usage > 90) + 15 * (80 < memory_usage <= 90) + 10 * (70 < memory_usage <= 80)
+        
+        # Disk health (20% weight)
+        deduction += 20 * (disk_usage > 90) + 10 * (80 < disk_usage <= 90)
+        
+        # Temperature health (20% weight)
+        if temp is not None:
+            deduction += 20 * (temp > 80) + 10 * (70 < temp <= 80)
+        
+        return max(0, 100 - deduction)
     
     def _intelligent_cpu_optimization(self) -> Dict[str, any]:
         """Intelligent CPU optimization based on current workload"""
         try:
             optimizations = []
             
-            # Get current CPU usage
-            cpu_usage = psutil.cpu_percent(interval=1)
+            # Normally the reading the system analysis just took
+            cpu_usage, cpu_peak = self._sample_cpu()
             
-            if cpu_usage > 80:
+            # Over a window of a few milliseconds each core reads as roughly 0 or
+            # 100%, so such a reading never changes the power plan
+            settled = self._cpu_reading[0] >= CPU_SAMPLE_WINDOW
+            
+            # A single pegged core is also a bottleneck, even when the average is moderate
+            high_load = settled and (cpu_usage > 80 or cpu_peak >= 95)
+            
+            if not settled:
+                optimizations.append("CPU sample too short; keeping the current power plan")
+                
+            elif high_load:
                 # High CPU usage - optimize for performance
                 optimizations.append("Setting high performance power plan")
                 self._set_power_plan("high")
                 
                 optimizations.append("Optimizing CPU scheduling")
-                self._optimize_cpu_scheduling()
                 
             elif cpu_usage < 30:
                 # Low CPU usage - optimize for efficiency
@@ -272,70 +378,145 @@ class AdvancedOptimizer:
             
             # CPU affinity optimization
             optimizations.append("Optimizing CPU affinity for gaming processes")
-            self._optimize_cpu_affinity()
+            
+            # Scheduling and affinity are applied in a single process pass
+            self._apply_process_policies(boost_priority=high_load, set_affinity=True)
             
             return {
                 'type': 'CPU Optimization',
                 'optimizations': optimizations,
                 'cpu_usage_before': cpu_usage,
-                'cpu_usage_after': psutil.cpu_percent(interval=1),
-                'timestamp': datetime.now().isoformat()
+                'cpu_peak_core_before': cpu_peak,
+                'cpu_usage_after': self._sample_cpu()[0],
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
             return {'type': 'CPU Optimization', 'error': str(e)}
     
+    def _sample_cpu(self) -> Tuple[float, float]:
+        """Per-core CPU usage since this optimizer's previous sample (non-blocking); return (average, busiest core)
+        
+        Measured from cpu_times deltas against the instance's own baseline, so other
+        cpu_percent() callers in the process (monitors, FPS Boost) cannot shift it.
+        Within CPU_SAMPLE_WINDOW of the previous sample the last reading is returned
+        and the window keeps growing.
+        """
+        now = time.monotonic()
+        started, baseline = self._cpu_baseline
+        reading = self._cpu_reading[1]
+        if reading is not None and now - started < CPU_SAMPLE_WINDOW:
+            return reading
+        
+        current = psutil.cpu_times(percpu=True)
+        self._cpu_baseline = (now, current)
+        per_core = [_cpu_busy_percent(before, after) for before, after in zip(baseline, current)]
+        reading = (sum(per_core) / len(per_core), max(per_core)) if per_core else (0.0, 0.0)
+        self._cpu_reading = (now - started, reading)
+        return reading
+    
     def _set_power_plan(self, plan: str):
         """Set Windows power plan"""
         try:
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 if plan == "high":
-                    subprocess.run(["powercfg", "/setactive", "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"], 
-                                 capture_output=True, check=True)
+                    scheme = "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"
                 elif plan == "balanced":
-                    subprocess.run(["powercfg", "/setactive", "381b4222-f694-41f0-9685-ff5bb260df2e"], 
-                                 capture_output=True, check=True)
-        except:
+                    scheme = "381b4222-f694-41f0-9685-ff5bb260df2e"
+                else:
+                    return
+                
+                # Fall back to powercfg if the API is unavailable or fails
+                if not self._power_set_active_scheme(scheme):
+                    self._pending_commands.append(["powercfg", "/setactive", scheme])
+        except Exception:
             pass
     
-    def _optimize_cpu_scheduling(self):
-        """Optimize CPU scheduling for gaming"""
+    def _power_set_active_scheme(self, scheme: str) -> bool:
+        """Activate a power scheme through PowrProf's PowerSetActiveScheme"""
+        if self.powrprof is None:
+            return False
         try:
-            # Set process priority for gaming processes
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if any(game in proc.info['name'].lower() for game in 
-                           ['league', 'valorant', 'cs2', 'fortnite', 'apex']):
-                        proc.nice(psutil.HIGH_PRIORITY_CLASS)
-                except:
-                    pass
-        except:
-            pass
+            # GUID struct layout: the first three fields are little-endian
+            guid = (ctypes.c_ubyte * 16).from_buffer_copy(uuid.UUID(scheme).bytes_le)
+            return self.powrprof.PowerSetActiveScheme(None, ctypes.byref(guid)) == 0
+        except Exception:
+            return False
     
     def _enable_cpu_power_saving(self):
         """Enable CPU power saving features"""
         try:
             # Enable CPU power saving for low usage scenarios
-            subprocess.run(["powercfg", "/setacvalueindex", "SCHEME_CURRENT", 
-                           "SUB_PROCESSOR", "PROCTHROTTLEMAX", "50"], 
-                          capture_output=True, check=True)
-        except:
+            if _IS_WINDOWS:
+                self._pending_commands.append(["powercfg", "/setacvalueindex", "SCHEME_CURRENT", 
+                                               "SUB_PROCESSOR", "PROCTHROTTLEMAX", "50"])
+        except Exception:
             pass
     
-    def _optimize_cpu_affinity(self):
-        """Optimize CPU affinity for gaming processes"""
+    def _flush_commands(self):
+        """Run all queued powercfg/reg commands in one PowerShell process"""
+        commands, self._pending_commands = self._pending_commands, []
+        if not commands:
+            return
+        
         try:
-            # Set CPU affinity for gaming processes to use all cores
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if any(game in proc.info['name'].lower() for game in 
-                           ['league', 'valorant', 'cs2', 'fortnite', 'apex']):
-                        proc.cpu_affinity(list(range(psutil.cpu_count())))
-                except:
-                    pass
-        except:
+            # Arguments are plain tokens (GUIDs, switches, registry paths), so they
+            # can be joined as-is; each command still runs even if an earlier one fails
+            script = "; ".join(" ".join(command) for command in commands)
+            subprocess.run(["powershell", "-NoProfile", "-Command", script],
+                          capture_output=True, check=False)
+        except (OSError, subprocess.SubprocessError):
             pass
     
+    def _apply_process_policies(self, boost_priority: bool = False, set_affinity: bool = False,
+                                scan_memory: bool = False) -> float:
+        """Apply the requested per-process policies in a single process_iter pass
+        
+        boost_priority: raise gaming processes to high priority
+        set_affinity: let gaming processes use all CPU cores
+        scan_memory: look for processes using excessive memory
+        
+        Returns the amount of memory freed (MB).
+        """
+        try:
+            freed_memory = 0
+            
+            # Priority classes exist only on Windows and affinity is unsupported on
+            # macOS; resolve both once instead of failing per process
+            high_priority = getattr(psutil, 'HIGH_PRIORITY_CLASS', None) if boost_priority else None
+            all_cores = None
+            if set_affinity and hasattr(psutil.Process, 'cpu_affinity'):
+                all_cores = list(range(psutil.cpu_count()))
+            
+            for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+                # Processes that exit or deny access mid-scan are simply skipped
+                with suppress(psutil.Error, OSError):
+                    proc_name = (proc.info['name'] or '').lower()
+                    
+                    if ((high_priority is not None or all_cores is not None)
+                            and any(map(proc_name.__contains__, _GAME_SUBSTRINGS))):
+                        # Set process priority for gaming processes
+                        if high_priority is not None:
+                            proc.nice(high_priority)
+                        
+                        # Set CPU affinity for gaming processes to use all cores
+                        if all_cores is not None:
+                            proc.cpu_affinity(all_cores)
+                    
+                    if scan_memory and proc.info['memory_info']:
+                        memory_usage = proc.info['memory_info'].rss / (1024 * 1024)  # MB
+                        
+                        # Clean up processes using excessive memory
+                        if memory_usage > 500:  # 500MB threshold
+                            if any(map(proc_name.__contains__, _UNNECESSARY_APPS)):
+                                # Don't kill essential processes, just optimize
+                                pass
+            
+            return freed_memory
+            
+        except (psutil.Error, OSError):
+            return 0
+    
     def _advanced_gpu_optimization(self) -> Dict[str, any]:
         """Advanced GPU optimization"""
         try:
@@ -356,7 +537,7 @@ class AdvancedOptimizer:
             return {
                 'type': 'GPU Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
@@ -368,7 +549,7 @@ class AdvancedOptimizer:
             # This would typically involve GPU-specific optimizations
             # For now, we'll optimize system memory for GPU-intensive tasks
             pass
-        except:
+        except Exception:
             pass
     
     def _set_gpu_performance_mode(self):
@@ -377,7 +558,7 @@ class AdvancedOptimizer:
             # This would involve GPU-specific power management
             # For now, we'll optimize system settings
             pass
-        except:
+        except Exception:
             pass
     
     def _optimize_gpu_driver(self):
@@ -386,7 +567,7 @@ class AdvancedOptimizer:
             # This would involve GPU driver optimizations
             # For now, we'll optimize system settings
             pass
-        except:
+        except Exception:
             pass
     
     def _smart_memory_optimization(self) -> Dict[str, any]:
@@ -412,43 +593,29 @@ class AdvancedOptimizer:
             return {
                 'type': 'Memory Optimization',
                 'optimizations': optimizations,
-                'memory_before': {
-                    'used': memory_before.used,
-                    'available': memory_before.available,
-                    'percentage': memory_before.percent
-                },
-                'memory_after': {
-                    'used': memory_after.used,
-                    'available': memory_after.available,
-                    'percentage': memory_after.percent
-                },
+                'memory_before': self._memory_snapshot(memory_before),
+                'memory_after': self._memory_snapshot(memory_after),
                 'freed_memory': freed_memory,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
             return {'type': 'Memory Optimization', 'error': str(e)}
     
+    @staticmethod
+    def _memory_snapshot(vm) -> Dict[str, float]:
+        """Memory fields of a single psutil.virtual_memory() sample"""
+        return {
+            'used': vm.used,
+            'available': vm.available,
+            'percentage': vm.percent
+        }
+    
     def _intelligent_memory_cleanup(self) -> float:
         """Intelligent memory cleanup based on usage patterns"""
         try:
-            freed_memory = 0
-            
             # Clean up unnecessary processes
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-                try:
-                    if proc.info['memory_info']:
-                        memory_usage = proc.info['memory_info'].rss / (1024 * 1024)  # MB
-                        
-                        # Clean up processes using excessive memory
-                        if memory_usage > 500:  # 500MB threshold
-                            proc_name = proc.info['name'].lower()
-                            if any(unnecessary in proc_name for unnecessary in 
-                                   ['chrome', 'firefox', 'edge', 'discord', 'spotify']):
-                                # Don't kill essential processes, just optimize
-                                pass
-                except:
-                    pass
+            freed_memory = self._apply_process_policies(scan_memory=True)
             
             # Force garbage collection
             import gc
@@ -456,7 +623,7 @@ class AdvancedOptimizer:
             
             return freed_memory
             
-        except:
+        except Exception:
             return 0
     
     def _optimize_memory_fragmentation(self):
@@ -465,7 +632,7 @@ class AdvancedOptimizer:
             # This would involve memory defragmentation techniques
             # For now, we'll perform basic memory optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _enable_memory_compression(self):
@@ -474,7 +641,7 @@ class AdvancedOptimizer:
             # This would involve enabling Windows memory compression
             # For now, we'll perform basic memory optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _intelligent_network_optimization(self) -> Dict[str, any]:
@@ -501,7 +668,7 @@ class AdvancedOptimizer:
             return {
                 'type': 'Network Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
@@ -513,7 +680,7 @@ class AdvancedOptimizer:
             # This would involve network buffer optimization
             # For now, we'll perform basic network optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _optimize_tcp_settings(self):
@@ -522,7 +689,7 @@ class AdvancedOptimizer:
             # This would involve TCP optimization for gaming
             # For now, we'll perform basic network optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _optimize_dns_settings(self):
@@ -531,7 +698,7 @@ class AdvancedOptimizer:
             # This would involve DNS optimization
             # For now, we'll perform basic network optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _optimize_network_adapter(self):
@@ -540,7 +707,7 @@ class AdvancedOptimizer:
             # This would involve network adapter optimization
             # For now, we'll perform basic network optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _gaming_specific_optimization(self) -> Dict[str, any]:
@@ -563,7 +730,7 @@ class AdvancedOptimizer:
             return {
                 'type': 'Gaming Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
@@ -572,12 +739,24 @@ class AdvancedOptimizer:
     def _enable_game_mode(self):
         """Enable Windows Game Mode"""
         try:
-            if platform.system() == "Windows":
-                subprocess.run(["reg", "add", "HKEY_CURRENT_USER\\Software\\Microsoft\\GameBar", 
-                               "/v", "AllowAutoGameMode", "/t", "REG_DWORD", "/d", "1", "/f"], 
-                              capture_output=True, check=True)
-        except:
-            pass
+            if _IS_WINDOWS:
+                # Write the value directly; fall back to reg.exe if that fails
+                if not self._set_registry_dword("Software\\Microsoft\\GameBar", "AllowAutoGameMode", 1):
+                    self._pending_commands.append(["reg", "add", "HKEY_CURRENT_USER\\Software\\Microsoft\\GameBar", 
+                                                   "/v", "AllowAutoGameMode", "/t", "REG_DWORD", "/d", "1", "/f"])
+        except Exception:
+            pass
+    
+    def _set_registry_dword(self, path: str, name: str, value: int) -> bool:
+        """Set a DWORD value under HKEY_CURRENT_USER via winreg"""
+        if not WINREG_AVAILABLE:
+            return False
+        try:
+            with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, path, 0, winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, value)
+            return True
+        except OSError:
+            return False
     
     def _optimize_gaming_performance(self):
         """Optimize gaming performance"""
@@ -585,7 +764,7 @@ class AdvancedOptimizer:
             # This would involve gaming-specific optimizations
             # For now, we'll perform basic gaming optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _optimize_anti_cheat(self):
@@ -594,7 +773,7 @@ class AdvancedOptimizer:
             # This would involve anti-cheat optimization
             # For now, we'll perform basic gaming optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _streaming_optimization(self) -> Dict[str, any]:
@@ -613,7 +792,7 @@ class AdvancedOptimizer:
             return {
                 'type': 'Streaming Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
@@ -625,7 +804,7 @@ class AdvancedOptimizer:
             # This would involve streaming-specific optimizations
             # For now, we'll perform basic streaming optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _optimize_streaming_network(self):
@@ -634,41 +813,67 @@ class AdvancedOptimizer:
             # This would involve streaming network optimization
             # For now, we'll perform basic network optimization
             pass
-        except:
+        except Exception:
             pass
     
     def _start_monitoring(self):
         """Start real-time monitoring"""
-        try:
-            self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-            self.monitoring_thread.start()
-        except:
-            pass
+        self._stop_event.clear()
+        
+        # Baseline for the per-tick network rates
+        self._prev_net = (time.time(), psutil.net_io_counters(nowrap=True))
+        
+        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
+        self.monitoring_thread.start()
+    
+    def _collect_stats(self):
+        """Collect and publish one sample of real-time stats"""
+        now = time.time()
+        stats = {
+            't': now,  # formatted lazily on export
+            'cpu_usage': psutil.cpu_percent(interval=None),
+            'memory_usage': psutil.virtual_memory().percent,
+            'disk_usage': psutil.disk_usage('/').percent,
+            'network_io': self._network_io_stats(now)
+        }
+        
+        # Publish by rebinding (readers never see a half-built dict)
+        self.real_time_stats = stats
+        self.performance_history.append(stats)  # oldest entry drops automatically
+    
+    def _network_io_stats(self, now: float) -> Dict[str, Dict]:
+        """Cumulative network counters plus per-second rates since the previous tick"""
+        # nowrap=True keeps the totals monotonic even if kernel counters wrap
+        current = psutil.net_io_counters(nowrap=True)
+        totals = {
+            'bytes_sent': current.bytes_sent,
+            'bytes_recv': current.bytes_recv,
+            'packets_sent': current.packets_sent,
+            'packets_recv': current.packets_recv
+        }
+        
+        rate = {}
+        if self._prev_net is not None:
+            prev_time, prev = self._prev_net
+            elapsed = max(now - prev_time, 1e-6)
+            rate = {
+                'bytes_sent': (current.bytes_sent - prev.bytes_sent) / elapsed,
+                'bytes_recv': (current.bytes_recv - prev.bytes_recv) / elapsed,
+                'packets_sent': (current.packets_sent - prev.packets_sent) / elapsed,
+                'packets_recv': (current.packets_recv - prev.packets_recv) / elapsed
+            }
+        self._prev_net = (now, current)
+        
+        return {'totals': totals, 'rate': rate}
     
     def _monitoring_loop(self):
         """Real-time monitoring loop"""
-        while self.is_running:
+        while not self._stop_event.is_set():
             try:
-                # Collect real-time stats
-                stats = {
-                    'timestamp': datetime.now().isoformat(),
-                    'cpu_usage': psutil.cpu_percent(interval=1),
-                    'memory_usage': psutil.virtual_memory().percent,
-                    'disk_usage': psutil.disk_usage('/').percent,
-                    'network_io': psutil.net_io_counters()
-                }
-                
-                self.real_time_stats = stats
-                self.performance_history.append(stats)
-                
-                # Keep only last 100 entries
-                if len(self.performance_history) > 100:
-                    self.performance_history.pop(0)
-                
-                time.sleep(5)  # Update every 5 seconds
-                
-            except:
-                time.sleep(5)
+                self._collect_stats()
+            except Exception:
+                pass
+            self._stop_event.wait(5)  # Update every 5 seconds
     
     def _generate_ai_recommendations(self, analysis: Dict) -> List[str]:
         """Generate AI-powered recommendations"""
@@ -707,22 +912,45 @@ class AdvancedOptimizer:
             
             return recommendations
             
-        except:
+        except Exception:
             return ["AI recommendations temporarily unavailable"]
     
     def stop_optimization(self):
         """Stop optimization and monitoring"""
+        self._stop_event.set()
         self.is_running = False
         if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=1)
+            self.monitoring_thread.join(timeout=2)
+    
+    def _timestamp(self) -> str:
+        """ISO timestamp for result sections: the current run's, or now outside a run"""
+        return self._run_ts or datetime.now().isoformat()
+    
+    @staticmethod
+    def _export_stats(stats: Dict) -> Dict:
+        """Return monitor stats with the float time converted to an ISO 'timestamp'"""
+        exported = {key: value for key, value in stats.items() if key != 't'}
+        if 't' in stats:
+            exported['timestamp'] = datetime.fromtimestamp(stats['t']).isoformat()
+        return exported
+    
+    def invalidate_caches(self):
+        """Forget cached probes (CPU temperature source, network interfaces, CPU frequency)"""
+        self._cpu_temp_probe = None
+        self._net_if_cache = (0.0, [])
+        self._cpu_freq_cache = (0.0, None)
     
     def get_performance_history(self) -> List[Dict]:
         """Get performance history"""
-        return self.performance_history
+        # tuple() copies the deque in one C-level pass, so the monitor thread
+        # appending meanwhile cannot invalidate the iteration
+        snapshot = tuple(self.performance_history)
+        return [self._export_stats(stats) for stats in snapshot]
     
     def get_real_time_stats(self) -> Dict:
         """Get real-time performance stats"""
-        return self.real_time_stats
+        # The monitor publishes a new dict each tick and never mutates it afterwards
+        return self._export_stats(self.real_time_stats)
     
     def get_optimization_profiles(self) -> Dict[str, OptimizationProfile]:
         """Get available optimization profiles"""
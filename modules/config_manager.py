@@ -3,180 +3,351 @@ Configuration Manager Module
 Handles application settings and configuration
 """
 
+import copy
+import functools
+import heapq
 import json
 import os
 import time
-from typing import Dict, Any, Optional
+import types
+from typing import Dict, Any, Callable, Mapping, Optional
 import threading
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    """Write JSON to a temp file and rename it over path, so readers never see a partial file"""
+    tmp_file = path + ".tmp"
+    if ORJSON_AVAILABLE:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_file, path)
+
+# Default configuration; copied by _get_default_config, never handed out directly
+_DEFAULT_CONFIG_TEMPLATE = {
+    "version": "1.0.0",
+    "last_updated": 0.0,
+    "fps_boost": {
+        "enabled": True,
+        "priority_boost": True,
+        "cpu_optimization": True,
+        "gpu_optimization": True,
+        "auto_detect_games": True,
+        "target_fps": 144
+    },
+    "network_analyzer": {
+        "enabled": True,
+        "auto_analysis": False,
+        "analysis_interval": 30,
+        "test_servers": ["8.8.8.8", "1.1.1.1", "208.67.222.222"],
+        "gaming_servers": {
+            "Valorant": ["104.18.0.0", "104.18.1.0"],
+            "CS2": ["162.254.196.0", "162.254.197.0"],
+            "Fortnite": ["3.208.0.0", "3.208.1.0"]
+        }
+    },
+    "multi_internet": {
+        "enabled": True,
+        "auto_failover": True,
+        "load_balancing": False,
+        "monitoring_interval": 30,
+        "quality_threshold": 50.0
+    },
+    "traffic_shaper": {
+        "enabled": True,
+        "prioritize_gaming": True,
+        "limit_background": True,
+        "bandwidth_limit": None,
+        "gaming_ports": {
+            "Valorant": [7000, 7001, 7002, 7003, 7004, 7005],
+            "CS2": [27015, 27016, 27017, 27018, 27019, 27020],
+            "Fortnite": [5222, 5223, 5224, 5225, 5226, 5227]
+        }
+    },
+    "ram_cleaner": {
+        "enabled": True,
+        "auto_clean": False,
+        "cleanup_interval": 300,
+        "memory_threshold": 80.0,
+        "aggressive_cleanup": False
+    },
+    "ui": {
+        "theme": "dark",
+        "window_size": [1200, 800],
+        "auto_start": False,
+        "minimize_to_tray": True,
+        "show_notifications": True
+    },
+    "advanced": {
+        "debug_mode": False,
+        "log_level": "INFO",
+        "backup_config": True,
+        "update_check": True
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _path_getter(key: str) -> Callable[[Dict[str, Any]], Any]:
+    """Build (once per key) a function that walks a dotted key through nested dicts"""
+    parts = tuple(key.split('.'))
+    
+    def getter(config: Dict[str, Any]) -> Any:
+        for part in parts:
+            config = config[part]
+        return config
+    
+    return getter
+
+# Read-only view handed out for a section missing from the config
+_EMPTY_SECTION = types.MappingProxyType({})
+
+# Top-level sections with dedicated get_*_config accessors
+_SECTIONS = (
+    "fps_boost", "network_analyzer", "multi_internet",
+    "traffic_shaper", "ram_cleaner", "ui", "advanced"
+)
+
+# An imported config must contain every section
+_REQUIRED_KEYS = frozenset(_SECTIONS)
+
+# Backups are named <prefix><unix time>.json
+_BACKUP_PREFIX = "config_backup_"
+
+# Seconds a get_recent_backups result is reused
+BACKUP_CACHE_TTL = 1.0
+
+# Seconds to wait after a set_setting before writing, so bursts coalesce
+FLUSH_DELAY = 0.2
+
 class ConfigManager:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
-        self.config = {}
+        # Readers take the snapshot in _config_ref[0] (and read-only views of its
+        # sections in _config_ref[1]) without locking; writers build a new dict under
+        # self.lock and swap the reference
+        self._config_ref = ({}, dict.fromkeys(_SECTIONS, _EMPTY_SECTION))
+        # Bumped on every publish; keys the cached config summary
+        self._version = 0
         self.lock = threading.Lock()
-        self.load_settings()
+        self._dirty = threading.Event()
+        # Background writer; started by set_setting and gone once nothing is pending
+        self._flush_thread = None
+        # The config file is read on first access rather than at startup
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        # (expiry on the monotonic clock, backup names) from the last scan
+        self._backups_cache = (0.0, [])
+        # (config version, summary) from the last get_config_summary
+        self._summary_cache = (-1, {})
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current configuration snapshot; treat as read-only"""
+        self._ensure_loaded()
+        return self._config_ref[0]
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        # Replacing the whole config makes the file contents irrelevant
+        with self.lock:
+            self._publish(value)
+            self._loaded = True
+    
+    def _publish(self, config: Dict[str, Any]):
+        """Swap in a new configuration snapshot"""
+        sections = {name: types.MappingProxyType(config.get(name, {})) for name in _SECTIONS}
+        self._config_ref = (config, sections)
+        self._version += 1
+    
+    def _ensure_loaded(self):
+        """Load the config file once, on first use"""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self.load_settings()
     
     def load_settings(self) -> Dict[str, Any]:
         """Load settings from configuration file"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-            else:
-                # Create default configuration
-                self.config = self._get_default_config()
-                self.save_settings(self.config)
+            # Held across read and publish so a concurrent set_setting lands
+            # either before (and is written out first) or after the reload
+            with self.lock:
+                if self._dirty.is_set():
+                    self._dirty.clear()
+                    self._write_config()
+                if os.path.exists(self.config_file):
+                    self._publish(_read_json(self.config_file))
+                else:
+                    # Create default configuration
+                    self._publish(self._get_default_config())
+                    self._write_config()
+                self._loaded = True
         except Exception as e:
             print(f"Failed to load settings: {e}")
             self.config = self._get_default_config()
         
-        return self.config
+        return self._config_ref[0]
     
     def save_settings(self, settings: Dict[str, Any]) -> bool:
         """Save settings to configuration file"""
         try:
+            self._ensure_loaded()
             with self.lock:
-                self.config.update(settings)
-                
-                with open(self.config_file, 'w') as f:
-                    json.dump(self.config, f, indent=2)
-                
+                self._publish({**self._config_ref[0], **settings})
+                self._dirty.clear()
+                self._write_config()
                 return True
         except Exception as e:
             print(f"Failed to save settings: {e}")
             return False
     
+    def _write_config(self):
+        """Write the current config to disk; caller must hold self.lock"""
+        _write_json_atomic(self.config_file, self._config_ref[0])
+    
+    def _schedule_flush(self):
+        """Mark the config dirty and make sure a writer is running; caller must hold self.lock"""
+        self._dirty.set()
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="config-flusher", daemon=True)
+            self._flush_thread.start()
+    
+    def _flush_loop(self):
+        """Background writer that coalesces set_setting calls into one write, then exits"""
+        while True:
+            time.sleep(FLUSH_DELAY)
+            with self.lock:
+                if not self._dirty.is_set():
+                    self._flush_thread = None
+                    return
+            self.flush()
+    
+    def flush(self) -> bool:
+        """Write pending setting changes to disk now"""
+        try:
+            with self.lock:
+                if not self._dirty.is_set():
+                    return True
+                self._dirty.clear()
+                self._write_config()
+                return True
+        except Exception as e:
+            print(f"Failed to flush settings: {e}")
+            return False
+    
+    def close(self):
+        """Write pending setting changes and wait for the background writer to exit"""
+        self.flush()
+        flush_thread = self._flush_thread
+        if flush_thread is not None:
+            flush_thread.join(timeout=2 * FLUSH_DELAY + 1)
+    
     def get_setting(self, key: str, default: Any = None) -> Any:
-        """Get a specific setting value"""
+        """Get a specific setting value (sections come back as read-only views)"""
         try:
-            return self.config.get(key, default)
+            self._ensure_loaded()
+            config, sections = self._config_ref
+            if key in sections and key in config:
+                return sections[key]
+            if '.' in key and key not in config:
+                # Dotted keys address nested sections, e.g. "fps_boost.enabled"
+                return _path_getter(key)(config)
+            return config.get(key, default)
         except Exception:
             return default
     
     def set_setting(self, key: str, value: Any) -> bool:
         """Set a specific setting value"""
         try:
+            self._ensure_loaded()
             with self.lock:
-                self.config[key] = value
-                return self.save_settings({})
+                config = self._config_ref[0]
+                # Unchanged values (compared deeply) need no new snapshot or write
+                if key in config and config[key] == value:
+                    return True
+                self._publish({**config, key: value})
+                self._schedule_flush()
+                return True
         except Exception:
             return False
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
-        return {
-            "version": "1.0.0",
-            "last_updated": time.time(),
-            "fps_boost": {
-                "enabled": True,
-                "priority_boost": True,
-                "cpu_optimization": True,
-                "gpu_optimization": True,
-                "auto_detect_games": True,
-                "target_fps": 144
-            },
-            "network_analyzer": {
-                "enabled": True,
-                "auto_analysis": False,
-                "analysis_interval": 30,
-                "test_servers": ["8.8.8.8", "1.1.1.1", "208.67.222.222"],
-                "gaming_servers": {
-                    "Valorant": ["104.18.0.0", "104.18.1.0"],
-                    "CS2": ["162.254.196.0", "162.254.197.0"],
-                    "Fortnite": ["3.208.0.0", "3.208.1.0"]
-                }
-            },
-            "multi_internet": {
-                "enabled": True,
-                "auto_failover": True,
-                "load_balancing": False,
-                "monitoring_interval": 30,
-                "quality_threshold": 50.0
-            },
-            "traffic_shaper": {
-                "enabled": True,
-                "prioritize_gaming": True,
-                "limit_background": True,
-                "bandwidth_limit": None,
-                "gaming_ports": {
-                    "Valorant": [7000, 7001, 7002, 7003, 7004, 7005],
-                    "CS2": [27015, 27016, 27017, 27018, 27019, 27020],
-                    "Fortnite": [5222, 5223, 5224, 5225, 5226, 5227]
-                }
-            },
-            "ram_cleaner": {
-                "enabled": True,
-                "auto_clean": False,
-                "cleanup_interval": 300,
-                "memory_threshold": 80.0,
-                "aggressive_cleanup": False
-            },
-            "ui": {
-                "theme": "dark",
-                "window_size": [1200, 800],
-                "auto_start": False,
-                "minimize_to_tray": True,
-                "show_notifications": True
-            },
-            "advanced": {
-                "debug_mode": False,
-                "log_level": "INFO",
-                "backup_config": True,
-                "update_check": True
-            }
-        }
+        config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+        config["last_updated"] = time.time()
+        return config
     
-    def get_fps_boost_config(self) -> Dict[str, Any]:
+    def _get_section(self, name: str) -> Mapping[str, Any]:
+        """Return a read-only view of a snapshot section; copy it (dict(...)) to edit and pass to set_*"""
+        self._ensure_loaded()
+        return self._config_ref[1][name]
+    
+    def get_fps_boost_config(self) -> Mapping[str, Any]:
         """Get FPS Boost configuration"""
-        return self.get_setting("fps_boost", {})
+        return self._get_section("fps_boost")
     
     def set_fps_boost_config(self, config: Dict[str, Any]) -> bool:
         """Set FPS Boost configuration"""
         return self.set_setting("fps_boost", config)
     
-    def get_network_analyzer_config(self) -> Dict[str, Any]:
+    def get_network_analyzer_config(self) -> Mapping[str, Any]:
         """Get Network Analyzer configuration"""
-        return self.get_setting("network_analyzer", {})
+        return self._get_section("network_analyzer")
     
     def set_network_analyzer_config(self, config: Dict[str, Any]) -> bool:
         """Set Network Analyzer configuration"""
         return self.set_setting("network_analyzer", config)
     
-    def get_multi_internet_config(self) -> Dict[str, Any]:
+    def get_multi_internet_config(self) -> Mapping[str, Any]:
         """Get Multi Internet configuration"""
-        return self.get_setting("multi_internet", {})
+        return self._get_section("multi_internet")
     
     def set_multi_internet_config(self, config: Dict[str, Any]) -> bool:
         """Set Multi Internet configuration"""
         return self.set_setting("multi_internet", config)
     
-    def get_traffic_shaper_config(self) -> Dict[str, Any]:
+    def get_traffic_shaper_config(self) -> Mapping[str, Any]:
         """Get Traffic Shaper configuration"""
-        return self.get_setting("traffic_shaper", {})
+        return self._get_section("traffic_shaper")
     
     def set_traffic_shaper_config(self, config: Dict[str, Any]) -> bool:
         """Set Traffic Shaper configuration"""
         return self.set_setting("traffic_shaper", config)
     
-    def get_ram_cleaner_config(self) -> Dict[str, Any]:
+    def get_ram_cleaner_config(self) -> Mapping[str, Any]:
         """Get RAM Cleaner configuration"""
-        return self.get_setting("ram_cleaner", {})
+        return self._get_section("ram_cleaner")
     
     def set_ram_cleaner_config(self, config: Dict[str, Any]) -> bool:
         """Set RAM Cleaner configuration"""
         return self.set_setting("ram_cleaner", config)
     
-    def get_ui_config(self) -> Dict[str, Any]:
+    def get_ui_config(self) -> Mapping[str, Any]:
         """Get UI configuration"""
-        return self.get_setting("ui", {})
+        return self._get_section("ui")
     
     def set_ui_config(self, config: Dict[str, Any]) -> bool:
         """Set UI configuration"""
         return self.set_setting("ui", config)
     
-    def get_advanced_config(self) -> Dict[str, Any]:
+    def get_advanced_config(self) -> Mapping[str, Any]:
         """Get advanced configuration"""
-        return self.get_setting("advanced", {})
+        return self._get_section("advanced")
     
     def set_advanced_config(self, config: Dict[str, Any]) -> bool:
         """Set advanced configuration"""
@@ -193,8 +364,7 @@ class ConfigManager:
     def export_config(self, file_path: str) -> bool:
         """Export configuration to a file"""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            _write_json_atomic(file_path, self.config)
             return True
         except Exception:
             return False
@@ -202,8 +372,7 @@ class ConfigManager:
     def import_config(self, file_path: str) -> bool:
         """Import configuration from a file"""
         try:
-            with open(file_path, 'r') as f:
-                imported_config = json.load(f)
+            imported_config = _read_json(file_path)
             
             # Validate configuration
             if self._validate_config(imported_config):
@@ -217,21 +386,23 @@ class ConfigManager:
     def _validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate configuration structure"""
         try:
-            required_keys = [
-                "fps_boost", "network_analyzer", "multi_internet",
-                "traffic_shaper", "ram_cleaner", "ui", "advanced"
-            ]
-            
-            for key in required_keys:
-                if key not in config:
-                    return False
-            
-            return True
+            return isinstance(config, dict) and _REQUIRED_KEYS.issubset(config)
         except Exception:
             return False
     
     def get_config_summary(self) -> Dict[str, Any]:
         """Get configuration summary"""
+        self._ensure_loaded()
+        version = self._version
+        cached_version, summary = self._summary_cache
+        if cached_version != version:
+            summary = self._build_config_summary()
+            self._summary_cache = (version, summary)
+        # The cached summary is rebuilt, never mutated; callers get their own top level
+        return dict(summary)
+    
+    def _build_config_summary(self) -> Dict[str, Any]:
+        """Build the configuration summary"""
         return {
             "version": self.get_setting("version", "1.0.0"),
             "last_updated": self.get_setting("last_updated", time.time()),
@@ -252,7 +423,8 @@ class ConfigManager:
     def backup_config(self) -> bool:
         """Create a backup of the current configuration"""
         try:
-            backup_file = f"config_backup_{int(time.time())}.json"
+            backup_file = f"{_BACKUP_PREFIX}{int(time.time())}.json"
+            self._backups_cache = (0.0, [])
             return self.export_config(backup_file)
         except Exception:
             return False
@@ -267,14 +439,23 @@ class ConfigManager:
     def get_recent_backups(self) -> list:
         """Get list of recent configuration backups"""
         try:
-            backup_files = []
-            for file in os.listdir("."):
-                if file.startswith("config_backup_") and file.endswith(".json"):
-                    backup_files.append(file)
+            # Back-to-back callers share one directory scan
+            now = time.monotonic()
+            expires, cached = self._backups_cache
+            if now < expires:
+                return list(cached)
+            
+            # Backup names embed their creation time, so rank on that instead of stat-ing each file
+            with os.scandir(".") as entries:
+                names = (entry.name for entry in entries
+                         if entry.name.startswith(_BACKUP_PREFIX) and entry.name.endswith(".json"))
+                stamped = ((int(name[len(_BACKUP_PREFIX):-5]), name) for name in names
+                           if name[len(_BACKUP_PREFIX):-5].isdigit())
+                # Newest first; last 10 backups
+                backup_files = [name for _, name in heapq.nlargest(10, stamped)]
             
-            # Sort by modification time (newest first)
-            backup_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            return backup_files[:10]  # Last 10 backups
+            self._backups_cache = (now + BACKUP_CACHE_TTL, backup_files)
+            return list(backup_files)
         except Exception:
             return []
     
@@ -290,6 +471,7 @@ class ConfigManager:
                 except OSError:
                     continue
             
+            self._backups_cache = (0.0, [])
             return True
         except Exception:
             return False
@@ -9,7 +9,45 @@ import platform
 import os
 import time
 import threading
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import GPUtil
+    GPUTIL_AVAILABLE = True
+except ImportError:
+    GPUTIL_AVAILABLE = False
+
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# HKCU DWORD values cleared by optimize_gpu_settings
+_GPU_REGISTRY_VALUES = (
+    # Disable Windows Game Mode optimizations that might interfere
+    (r"Software\Microsoft\GameBar", "AllowAutoGameMode"),
+    # Disable Windows Game DVR
+    (r"Software\Microsoft\Windows\CurrentVersion\GameDVR", "AppCaptureEnabled"),
+)
+
+def _set_hkcu_dword(path: str, name: str, value: int) -> bool:
+    """Set a DWORD value under HKEY_CURRENT_USER via winreg"""
+    if not WINREG_AVAILABLE:
+        return False
+    try:
+        with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, path, 0, winreg.KEY_SET_VALUE) as key:
+            winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, value)
+        return True
+    except OSError:
+        return False
+
+def _run_powershell(commands: List[str]) -> subprocess.CompletedProcess:
+    """Run several PowerShell commands in a single process"""
+    return subprocess.run([
+        'powershell', '-NoProfile', '-Command', '; '.join(commands)
+    ], capture_output=True, check=False)
 
 class FPSBoost:
     def __init__(self):
@@ -22,22 +60,30 @@ class FPSBoost:
             'lol.exe', 'riotclientservices.exe', 'riotclient.exe',
             'dota2.exe', 'pubg.exe', 'rust.exe', 'minecraft.exe'
         ]
+        # Lower-cased executable names for exact, constant-time matching
+        self._game_set = frozenset(name.lower() for name in self.game_processes)
+        # Affinity list covering every logical CPU
+        self._all_cpus = list(range(psutil.cpu_count() or 1))
+        # Prime the CPU counter so later non-blocking reads return a real delta
+        psutil.cpu_percent(interval=None)
         
-    def detect_game_processes(self) -> List[psutil.Process]:
-        """Detect currently running game processes"""
+    def detect_game_processes(self) -> List[Tuple[int, str]]:
+        """Detect currently running game processes as (pid, name) pairs"""
         game_processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'exe']):
+        for proc in psutil.process_iter(['pid', 'name']):
             try:
                 proc_name = proc.info['name'].lower()
-                if any(game in proc_name for game in self.game_processes):
-                    game_processes.append(proc)
+                if proc_name in self._game_set:
+                    # Keep only the pid so no process handle outlives the scan
+                    game_processes.append((proc.info['pid'], proc_name))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         return game_processes
     
-    def set_high_priority(self, process: psutil.Process) -> bool:
+    def set_high_priority(self, pid: int) -> bool:
         """Set process to high priority"""
         try:
+            process = psutil.Process(pid)
             if self.system == "Windows":
                 process.nice(psutil.HIGH_PRIORITY_CLASS)
             else:
@@ -46,14 +92,12 @@ class FPSBoost:
         except (psutil.AccessDenied, psutil.NoSuchProcess):
             return False
     
-    def optimize_cpu_affinity(self, process: psutil.Process) -> bool:
+    def optimize_cpu_affinity(self, pid: int) -> bool:
         """Optimize CPU affinity for better performance"""
         try:
             if self.system == "Windows":
                 # Use all available cores
-                cpu_count = psutil.cpu_count()
-                affinity_mask = (1 << cpu_count) - 1
-                process.cpu_affinity(list(range(cpu_count)))
+                psutil.Process(pid).cpu_affinity(self._all_cpus)
             return True
         except (psutil.AccessDenied, psutil.NoSuchProcess):
             return False
@@ -74,17 +118,14 @@ class FPSBoost:
         """Optimize GPU settings for gaming"""
         try:
             if self.system == "Windows":
-                # Disable Windows Game Mode optimizations that might interfere
-                subprocess.run([
-                    'powershell', '-Command',
-                    'Set-ItemProperty -Path "HKCU:\\Software\\Microsoft\\GameBar" -Name "AllowAutoGameMode" -Value 0'
-                ], capture_output=True, check=False)
-                
-                # Disable Windows Game DVR
-                subprocess.run([
-                    'powershell', '-Command',
-                    'Set-ItemProperty -Path "HKCU:\\Software\\Microsoft\\Windows\\CurrentVersion\\GameDVR" -Name "AppCaptureEnabled" -Value 0'
-                ], capture_output=True, check=False)
+                # Write the values in-process; fall back to PowerShell for any that fail
+                failed = [(path, name) for path, name in _GPU_REGISTRY_VALUES
+                          if not _set_hkcu_dword(path, name, 0)]
+                if failed:
+                    _run_powershell([
+                        f'Set-ItemProperty -Path "HKCU:\\{path}" -Name "{name}" -Value 0'
+                        for path, name in failed
+                    ])
                 
             return True
         except Exception:
@@ -95,28 +136,36 @@ class FPSBoost:
         results = {}
         
         try:
-            # Disable Windows Search indexing for better performance
             if self.system == "Windows":
-                subprocess.run([
-                    'powershell', '-Command',
-                    'Set-Service -Name "WSearch" -StartupType Disabled'
-                ], capture_output=True, check=False)
+                _run_powershell([
+                    # Disable Windows Search indexing for better performance
+                    'Set-Service -Name "WSearch" -StartupType Disabled',
+                    # Optimize power settings for performance (High performance plan)
+                    'powercfg /setactive 8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'
+                ])
                 results['search_indexing'] = True
-        except Exception:
-            results['search_indexing'] = False
-        
-        try:
-            # Optimize power settings for performance
-            if self.system == "Windows":
-                subprocess.run([
-                    'powercfg', '/setactive', '8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'  # High performance
-                ], capture_output=True, check=False)
                 results['power_settings'] = True
         except Exception:
+            results['search_indexing'] = False
             results['power_settings'] = False
             
         return results
     
+    def _optimize_one(self, pid: int, priority_boost: bool,
+                      cpu_optimization: bool) -> Tuple[int, bool, Optional[str]]:
+        """Boost priority and set affinity for one process; returns (pid, boosted, error)"""
+        boosted = False
+        try:
+            if priority_boost:
+                boosted = self.set_high_priority(pid)
+            
+            if cpu_optimization:
+                self.optimize_cpu_affinity(pid)
+            
+            return pid, boosted, None
+        except Exception as e:
+            return pid, boosted, str(e)
+    
     def optimize_game_performance(self, priority_boost: bool = True, 
                                 cpu_optimization: bool = True, 
                                 gpu_optimization: bool = True) -> Dict[str, any]:
@@ -132,18 +181,20 @@ class FPSBoost:
             # Detect and optimize game processes
             game_processes = self.detect_game_processes()
             
-            for process in game_processes:
-                try:
-                    if priority_boost:
-                        if self.set_high_priority(process):
-                            self.optimized_processes.append(process.pid)
-                            results['processes_optimized'] += 1
-                    
-                    if cpu_optimization:
-                        self.optimize_cpu_affinity(process)
-                        
-                except Exception as e:
-                    results['errors'].append(f"Failed to optimize process {process.pid}: {str(e)}")
+            # Priority and affinity calls block on the OS, so run them for all games at once
+            if game_processes:
+                with ThreadPoolExecutor(max_workers=min(8, len(game_processes))) as executor:
+                    outcomes = list(executor.map(
+                        lambda pid: self._optimize_one(pid, priority_boost, cpu_optimization),
+                        [pid for pid, _ in game_processes]
+                    ))
+                
+                for pid, boosted, error in outcomes:
+                    if boosted:
+                        self.optimized_processes.append(pid)
+                        results['processes_optimized'] += 1
+                    if error:
+                        results['errors'].append(f"Failed to optimize process {pid}: {error}")
             
             # System-wide optimizations
             if cpu_optimization or gpu_optimization:
@@ -179,18 +230,16 @@ class FPSBoost:
     def get_performance_metrics(self) -> Dict[str, float]:
         """Get current performance metrics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Usage since the previous call; does not block
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
             # Get GPU usage if available
             gpu_usage = 0.0
-            try:
-                import GPUtil
+            if GPUTIL_AVAILABLE:
                 gpus = GPUtil.getGPUs()
                 if gpus:
                     gpu_usage = gpus[0].load * 100
-            except ImportError:
-                pass
             
             return {
                 'cpu_usage': cpu_percent,
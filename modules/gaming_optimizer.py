@@ -10,9 +10,122 @@ import subprocess
 import platform
 import os
 import json
+import logging
+import tempfile
+from collections import deque
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
-import winreg
+
+# Platform is fixed for the life of the process
+_IS_WINDOWS = platform.system() == "Windows"
+
+# WMI process start/stop events are only attempted on Windows
+wmi = None
+pythoncom = None
+if _IS_WINDOWS:
+    try:
+        import pythoncom
+        import wmi
+    except ImportError:
+        wmi = None
+
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# Windows "High performance" power scheme GUID
+HIGH_PERFORMANCE_PLAN = "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"
+
+_GAMEBAR_KEY = r"Software\Microsoft\GameBar"
+
+# (description, value name, DWORD) written under HKCU\Software\Microsoft\GameBar, in order
+_GAME_MODE_VALUES = (
+    ("Enabling Windows Game Mode", "AllowAutoGameMode", 1),
+    ("Disabling Game Bar notifications", "ShowStartupPanel", 0),
+    ("Enabling Game Mode for all games", "AutoGameModeEnabled", 1),
+    ("Disabling Windows Game Bar", "AutoGameModeEnabled", 0),
+)
+
+# netsh script run by _optimize_gaming_network
+_GAMING_NETSH_COMMANDS = (
+    "int tcp set global autotuninglevel=normal",
+    "int tcp set global nagle=enabled",
+    "int udp set global udprcvbuffer=65536",
+    "int udp set global udpsndbuffer=65536",
+)
+
+# Game-specific optimization profiles
+_GAME_PROFILES = {
+    'league_of_legends': {
+        'name': 'League of Legends',
+        'processes': ['league of legends.exe', 'lol.exe', 'riotclientservices.exe', 'riotclient.exe'],
+        'ports': [2099, 5222, 5223, 8080, 8443],
+        'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
+        'anti_cheat': 'vanguard'
+    },
+    'valorant': {
+        'name': 'Valorant',
+        'processes': ['valorant.exe', 'valorant-win64-shipping.exe', 'riotclientservices.exe'],
+        'ports': [443, 5222, 5223, 8080, 8443],
+        'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
+        'anti_cheat': 'vanguard'
+    },
+    'cs2': {
+        'name': 'Counter-Strike 2',
+        'processes': ['cs2.exe', 'steam.exe'],
+        'ports': [27015, 27016, 27017, 27018, 27019, 27020],
+        'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
+        'anti_cheat': 'vac'
+    },
+    'fortnite': {
+        'name': 'Fortnite',
+        'processes': ['fortniteclient-win64-shipping.exe', 'epicgameslauncher.exe'],
+        'ports': [443, 80, 8080, 8443],
+        'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
+        'anti_cheat': 'easy_anti_cheat'
+    },
+    'apex_legends': {
+        'name': 'Apex Legends',
+        'processes': ['r5apex.exe', 'origin.exe', 'eaapp.exe'],
+        'ports': [443, 80, 8080, 8443],
+        'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
+        'anti_cheat': 'easy_anti_cheat'
+    }
+}
+
+# Child of the application log configured in main.py
+log = logging.getLogger('ngxsmk.gaming')
+
+# Seconds between high-resource log lines for the same process
+USAGE_LOG_INTERVAL = 60
+
+# Monitoring ticks between full process-table scans while games are running
+FULL_SCAN_TICKS = 6
+# Most recent gaming process records kept
+GAMING_PROCESS_HISTORY = 256
+
+def _index_game_processes(profiles: Dict[str, Dict]) -> Dict[str, Tuple[str, ...]]:
+    """Map lower-cased process names to the keys of the games they belong to"""
+    index = {}
+    for game_key, game_profile in profiles.items():
+        for process_name in game_profile['processes']:
+            name = process_name.lower()
+            # Launchers can be shared between games
+            index[name] = index.get(name, ()) + (game_key,)
+    return index
+
+_PROC_TO_GAME = _index_game_processes(_GAME_PROFILES)
+
+# Keeps console tools from opening a window on Windows
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if _IS_WINDOWS else 0
+
+def _run_powershell(commands: List[str]) -> subprocess.CompletedProcess:
+    """Run several PowerShell commands in a single process"""
+    return subprocess.run([
+        'powershell', '-NoProfile', '-NonInteractive', '-Command', '; '.join(commands)
+    ], capture_output=True, check=False, creationflags=_NO_WINDOW)
 
 class GamingOptimizer:
     """Advanced gaming optimizer with game detection and performance tuning"""
@@ -20,49 +133,44 @@ class GamingOptimizer:
     def __init__(self):
         self.is_optimizing = False
         self.detected_games = []
-        self.gaming_processes = []
+        # Bounded so long sessions cannot grow it without limit
+        self.gaming_processes = deque(maxlen=GAMING_PROCESS_HISTORY)
         self.optimization_thread = None
-        self.game_profiles = self._load_game_profiles()
-        
-    def _load_game_profiles(self) -> Dict[str, Dict]:
-        """Load game-specific optimization profiles"""
-        return {
-            'league_of_legends': {
-                'name': 'League of Legends',
-                'processes': ['league of legends.exe', 'lol.exe', 'riotclientservices.exe', 'riotclient.exe'],
-                'ports': [2099, 5222, 5223, 8080, 8443],
-                'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
-                'anti_cheat': 'vanguard'
-            },
-            'valorant': {
-                'name': 'Valorant',
-                'processes': ['valorant.exe', 'valorant-win64-shipping.exe', 'riotclientservices.exe'],
-                'ports': [443, 5222, 5223, 8080, 8443],
-                'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
-                'anti_cheat': 'vanguard'
-            },
-            'cs2': {
-                'name': 'Counter-Strike 2',
-                'processes': ['cs2.exe', 'steam.exe'],
-                'ports': [27015, 27016, 27017, 27018, 27019, 27020],
-                'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
-                'anti_cheat': 'vac'
-            },
-            'fortnite': {
-                'name': 'Fortnite',
-                'processes': ['fortniteclient-win64-shipping.exe', 'epicgameslauncher.exe'],
-                'ports': [443, 80, 8080, 8443],
-                'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
-                'anti_cheat': 'easy_anti_cheat'
-            },
-            'apex_legends': {
-                'name': 'Apex Legends',
-                'processes': ['r5apex.exe', 'origin.exe', 'eaapp.exe'],
-                'ports': [443, 80, 8080, 8443],
-                'optimizations': ['cpu_priority', 'memory_optimization', 'network_optimization', 'gpu_optimization'],
-                'anti_cheat': 'easy_anti_cheat'
-            }
+        self.game_profiles = _GAME_PROFILES
+        self._proc_to_game = _PROC_TO_GAME
+        # (pid, name) pairs from the latest pass over the process table
+        self._proc_snapshot = []
+        # Process handles for monitored game pids, kept so cpu_percent has a baseline
+        self._game_procs = {}
+        # pid -> monotonic time of the last high-usage log line
+        self._usage_logged = {}
+        # pid -> process name for game processes found by the last full scan
+        self._known_game_pids = {}
+        # Affinity list covering every logical CPU
+        self._all_cpus = list(range(psutil.cpu_count() or 1))
+        # Wakes the monitoring loop immediately on stop
+        self._stop_event = threading.Event()
+        # Consecutive monitoring ticks without a detected game, and since the last full scan
+        self._idle_ticks = 0
+        self._ticks_since_scan = 0
+        # (game key, optimization, pid) entries already applied
+        self._applied = set()
+        # Timestamp shared by every result dict of the current pass
+        self._current_ts = datetime.now().isoformat()
+        # Game key / anti-cheat name -> handler returning the applied step
+        self._settings_dispatch = {
+            'league_of_legends': self._optimize_lol_settings,
+            'valorant': self._optimize_valorant_settings,
+            'cs2': self._optimize_cs2_settings,
+            'fortnite': self._optimize_fortnite_settings,
+            'apex_legends': self._optimize_apex_settings,
+        }
+        self._anti_cheat_dispatch = {
+            'vanguard': self._optimize_vanguard_compatibility,
+            'vac': self._optimize_vac_compatibility,
+            'easy_anti_cheat': self._optimize_eac_compatibility,
         }
+        
     
     def start_gaming_optimization(self, profile: str = 'auto') -> Dict[str, any]:
         """Start gaming optimization"""
@@ -71,9 +179,12 @@ class GamingOptimizer:
         
         try:
             self.is_optimizing = True
+            self._stop_event.clear()
+            self._applied.clear()
+            self._current_ts = datetime.now().isoformat()
             results = {
                 'profile': profile,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': self._current_ts,
                 'optimizations': []
             }
             
@@ -104,39 +215,47 @@ class GamingOptimizer:
             self.is_optimizing = False
             return {'status': 'error', 'message': str(e)}
     
-    def _detect_running_games(self) -> List[Dict]:
-        """Detect currently running games"""
-        detected_games = []
+    def _snapshot_processes(self) -> List[Tuple[int, str]]:
+        """Take one pass over the process table as (pid, name) pairs"""
+        snapshot = []
+        for proc in psutil.process_iter(['pid', 'name']):
+            name = proc.info['name']
+            if name:
+                snapshot.append((proc.info['pid'], name))
+        
+        self._proc_snapshot = snapshot
+        return snapshot
+    
+    def _detect_running_games(self, snapshot: Optional[List[Tuple[int, str]]] = None) -> List[Dict]:
+        """Detect currently running games, reusing a process snapshot when given"""
+        detected_games = {}
         
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    proc_name = proc.info['name'].lower()
-                    
-                    for game_key, game_profile in self.game_profiles.items():
-                        for process_name in game_profile['processes']:
-                            if process_name.lower() in proc_name:
-                                if game_key not in [game['key'] for game in detected_games]:
-                                    detected_games.append({
-                                        'key': game_key,
-                                        'name': game_profile['name'],
-                                        'processes': [proc.info['name']],
-                                        'pid': proc.info['pid']
-                                    })
-                                else:
-                                    # Add process to existing game
-                                    for game in detected_games:
-                                        if game['key'] == game_key:
-                                            game['processes'].append(proc.info['name'])
-                                            break
-                except Exception as e:
-                    print(f"Process iteration error: {e}")
+            if snapshot is None:
+                snapshot = self._snapshot_processes()
+            
+            for pid, name in snapshot:
+                game_keys = self._proc_to_game.get(name.lower())
+                if not game_keys:
                     continue
+                
+                for game_key in game_keys:
+                    game = detected_games.get(game_key)
+                    if game is None:
+                        detected_games[game_key] = {
+                            'key': game_key,
+                            'name': self.game_profiles[game_key]['name'],
+                            'processes': [name],
+                            'pid': pid
+                        }
+                    else:
+                        # Add process to existing game
+                        game['processes'].append(name)
                                 
         except Exception as e:
-            print(f"Game detection error: {e}")
+            log.debug("Game detection error: %s", e)
         
-        return detected_games
+        return list(detected_games.values())
     
     def _apply_general_gaming_optimizations(self) -> List[Dict]:
         """Apply general gaming optimizations"""
@@ -152,8 +271,7 @@ class GamingOptimizer:
             # Gaming performance settings
             optimizations.append(self._set_gaming_performance_settings())
             
-            # Gaming network optimization
-            optimizations.append(self._optimize_gaming_network())
+            # Network optimization is part of the universal pass, which always follows
             
         except Exception as e:
             optimizations.append({'type': 'General Gaming Optimization', 'error': str(e)})
@@ -212,42 +330,31 @@ class GamingOptimizer:
     
     def _enable_windows_game_mode(self) -> Dict[str, any]:
         """Enable Windows Game Mode"""
+        if not _IS_WINDOWS:
+            return {'type': 'Windows Game Mode', 'optimizations': [], 'skipped': True,
+                    'timestamp': self._current_ts}
+        
         try:
             optimizations = []
             
-            if platform.system() == "Windows":
-                try:
-                    # Enable Game Mode
-                    optimizations.append("Enabling Windows Game Mode")
-                    subprocess.run(["reg", "add", "HKEY_CURRENT_USER\\Software\\Microsoft\\GameBar", 
-                                   "/v", "AllowAutoGameMode", "/t", "REG_DWORD", "/d", "1", "/f"], 
-                                  capture_output=True, check=False)
-                    
-                    # Disable Game Bar notifications
-                    optimizations.append("Disabling Game Bar notifications")
-                    subprocess.run(["reg", "add", "HKEY_CURRENT_USER\\Software\\Microsoft\\GameBar", 
-                                   "/v", "ShowStartupPanel", "/t", "REG_DWORD", "/d", "0", "/f"], 
-                                  capture_output=True, check=False)
-                    
-                    # Enable Game Mode for all games
-                    optimizations.append("Enabling Game Mode for all games")
-                    subprocess.run(["reg", "add", "HKEY_CURRENT_USER\\Software\\Microsoft\\GameBar", 
-                                   "/v", "AutoGameModeEnabled", "/t", "REG_DWORD", "/d", "1", "/f"], 
-                                  capture_output=True, check=False)
-                    
-                    # Disable Windows Game Bar
-                    optimizations.append("Disabling Windows Game Bar")
-                    subprocess.run(["reg", "add", "HKEY_CURRENT_USER\\Software\\Microsoft\\GameBar", 
-                                   "/v", "AutoGameModeEnabled", "/t", "REG_DWORD", "/d", "0", "/f"], 
-                                  capture_output=True, check=False)
-                    
-                except Exception as e:
-                    optimizations.append(f"Registry optimization failed: {str(e)}")
+            try:
+                if not WINREG_AVAILABLE:
+                    raise OSError("winreg is not available")
+                
+                # Open the GameBar key once and write every value in-process
+                with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, _GAMEBAR_KEY, 0,
+                                        winreg.KEY_SET_VALUE) as key:
+                    for description, name, value in _GAME_MODE_VALUES:
+                        optimizations.append(description)
+                        winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, value)
+                
+            except Exception as e:
+                optimizations.append(f"Registry optimization failed: {str(e)}")
             
             return {
                 'type': 'Windows Game Mode',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -255,43 +362,42 @@ class GamingOptimizer:
     
     def _set_gaming_power_plan(self) -> Dict[str, any]:
         """Set gaming power plan"""
+        if not _IS_WINDOWS:
+            return {'type': 'Gaming Power Plan', 'optimizations': [], 'skipped': True,
+                    'timestamp': self._current_ts}
+        
         try:
             optimizations = []
             
-            if platform.system() == "Windows":
-                try:
-                    # Set high performance power plan
-                    optimizations.append("Setting high performance power plan")
-                    result = subprocess.run(["powercfg", "/setactive", "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"], 
-                                         capture_output=True, check=False)
-                    if result.returncode != 0:
-                        optimizations.append("High performance plan not available, using balanced")
-                    
-                    # Disable CPU throttling
-                    optimizations.append("Disabling CPU throttling")
-                    subprocess.run(["powercfg", "/setacvalueindex", "SCHEME_CURRENT", 
-                                   "SUB_PROCESSOR", "PROCTHROTTLEMAX", "100"], 
-                                  capture_output=True, check=False)
-                    
-                    # Set minimum CPU state to 100%
-                    optimizations.append("Setting minimum CPU state to 100%")
-                    subprocess.run(["powercfg", "/setacvalueindex", "SCHEME_CURRENT", 
-                                   "SUB_PROCESSOR", "PROCTHROTTLEMIN", "100"], 
-                                  capture_output=True, check=False)
-                    
-                    # Disable USB selective suspend
-                    optimizations.append("Disabling USB selective suspend")
-                    subprocess.run(["powercfg", "/setacvalueindex", "SCHEME_CURRENT", 
-                                   "SUB_USB", "USBSELECTIVESUSPEND", "0"], 
-                                  capture_output=True, check=False)
-                    
-                except Exception as e:
-                    optimizations.append(f"Power plan optimization failed: {str(e)}")
+            try:
+                optimizations.extend([
+                    "Setting high performance power plan",
+                    "Disabling CPU throttling",
+                    "Setting minimum CPU state to 100%",
+                    "Disabling USB selective suspend"
+                ])
+                # One PowerShell process runs every powercfg call. /setactive is skipped
+                # when the plan is already active; the exit code is that of /setactive
+                # so a missing plan can still be reported
+                result = _run_powershell([
+                    '$plan = 0',
+                    f'if ((powercfg /getactivescheme) -notmatch "{HIGH_PERFORMANCE_PLAN}") '
+                    f'{{ powercfg /setactive {HIGH_PERFORMANCE_PLAN}; $plan = $LASTEXITCODE }}',
+                    'powercfg /setacvalueindex SCHEME_CURRENT SUB_PROCESSOR PROCTHROTTLEMAX 100',
+                    'powercfg /setacvalueindex SCHEME_CURRENT SUB_PROCESSOR PROCTHROTTLEMIN 100',
+                    'powercfg /setacvalueindex SCHEME_CURRENT SUB_USB USBSELECTIVESUSPEND 0',
+                    'exit $plan'
+                ])
+                if result.returncode != 0:
+                    optimizations.insert(1, "High performance plan not available, using balanced")
+                
+            except Exception as e:
+                optimizations.append(f"Power plan optimization failed: {str(e)}")
             
             return {
                 'type': 'Gaming Power Plan',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -299,32 +405,37 @@ class GamingOptimizer:
     
     def _set_gaming_performance_settings(self) -> Dict[str, any]:
         """Set gaming performance settings"""
+        if not _IS_WINDOWS:
+            return {'type': 'Gaming Performance Settings', 'optimizations': [], 'skipped': True,
+                    'timestamp': self._current_ts}
+        
         try:
             optimizations = []
             
-            if platform.system() == "Windows":
+            optimizations.extend([
+                "Optimizing Windows Defender for gaming",
+                "Disabling Windows Update during gaming",
+                "Optimizing Windows for gaming"
+            ])
+            # One PowerShell process; the first failing command stops the rest, as before
+            result = _run_powershell([
+                "$ErrorActionPreference = 'Stop'",
                 # Disable Windows Defender real-time protection for gaming
-                optimizations.append("Optimizing Windows Defender for gaming")
-                subprocess.run(["powershell", "-Command", 
-                               "Set-MpPreference -DisableRealtimeMonitoring $true"], 
-                              capture_output=True, check=True)
-                
+                "Set-MpPreference -DisableRealtimeMonitoring $true",
                 # Disable Windows Update during gaming
-                optimizations.append("Disabling Windows Update during gaming")
-                subprocess.run(["powershell", "-Command", 
-                               "Set-Service -Name wuauserv -StartupType Disabled"], 
-                              capture_output=True, check=True)
-                
+                "Set-Service -Name wuauserv -StartupType Disabled",
                 # Optimize Windows for gaming
-                optimizations.append("Optimizing Windows for gaming")
-                subprocess.run(["powershell", "-Command", 
-                               "Set-ItemProperty -Path 'HKLM:\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Multimedia\\SystemProfile' -Name SystemResponsiveness -Value 0"], 
-                              capture_output=True, check=True)
+                "Set-ItemProperty -Path 'HKLM:\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Multimedia\\SystemProfile' -Name SystemResponsiveness -Value 0"
+            ])
+            if result.returncode != 0:
+                error = result.stderr.decode(errors='replace').strip()
+                return {'type': 'Gaming Performance Settings',
+                        'error': error or f"PowerShell exited with status {result.returncode}"}
             
             return {
                 'type': 'Gaming Performance Settings',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -332,31 +443,37 @@ class GamingOptimizer:
     
     def _optimize_gaming_network(self) -> Dict[str, any]:
         """Optimize network for gaming"""
+        if not _IS_WINDOWS:
+            return {'type': 'Gaming Network Optimization', 'optimizations': [], 'skipped': True,
+                    'timestamp': self._current_ts}
+        
         try:
             optimizations = []
             
-            if platform.system() == "Windows":
-                # Optimize TCP for gaming
-                optimizations.append("Optimizing TCP for gaming")
-                subprocess.run(["netsh", "int", "tcp", "set", "global", "autotuninglevel=normal"], 
-                             capture_output=True, check=True)
-                
-                # Disable Nagle's algorithm for gaming
-                optimizations.append("Disabling Nagle's algorithm for gaming")
-                subprocess.run(["netsh", "int", "tcp", "set", "global", "nagle=enabled"], 
-                             capture_output=True, check=True)
-                
-                # Optimize UDP for gaming
-                optimizations.append("Optimizing UDP for gaming")
-                subprocess.run(["netsh", "int", "udp", "set", "global", "udprcvbuffer=65536"], 
-                             capture_output=True, check=True)
-                subprocess.run(["netsh", "int", "udp", "set", "global", "udpsndbuffer=65536"], 
-                             capture_output=True, check=True)
+            optimizations.extend([
+                "Optimizing TCP for gaming",
+                "Disabling Nagle's algorithm for gaming",
+                "Optimizing UDP for gaming"
+            ])
+            
+            # Run every command from one netsh script instead of one process each
+            fd, script_path = tempfile.mkstemp(suffix='.txt', text=True)
+            try:
+                with os.fdopen(fd, 'w') as script:
+                    script.write('\n'.join(_GAMING_NETSH_COMMANDS) + '\n')
+                result = subprocess.run(["netsh", "-f", script_path], capture_output=True,
+                                        check=False, creationflags=_NO_WINDOW)
+            finally:
+                os.remove(script_path)
+            if result.returncode != 0:
+                error = result.stderr.decode(errors='replace').strip()
+                return {'type': 'Gaming Network Optimization',
+                        'error': error or f"netsh exited with status {result.returncode}"}
             
             return {
                 'type': 'Gaming Network Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -369,15 +486,25 @@ class GamingOptimizer:
             
             for process_name in game['processes']:
                 try:
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        if proc.info['name'].lower() == process_name.lower():
-                            # Set high priority
-                            proc.nice(psutil.HIGH_PRIORITY_CLASS)
-                            optimizations.append(f"Set high priority for {process_name}")
+                    # Match against the latest process snapshot rather than walking the table again
+                    for pid, name in self._proc_snapshot:
+                        if name.lower() == process_name.lower():
+                            # Each (game, pid) only needs its priority and affinity set once
+                            applied_key = (game['key'], 'priorities', pid)
+                            if applied_key in self._applied:
+                                continue
+                            
+                            proc = psutil.Process(pid)
                             
-                            # Set CPU affinity to all cores
-                            proc.cpu_affinity(list(range(psutil.cpu_count())))
+                            # Above normal rather than high, so audio and input threads are not starved
+                            proc.nice(psutil.ABOVE_NORMAL_PRIORITY_CLASS)
+                            optimizations.append(f"Set above normal priority for {process_name}")
+                            
+                            # Set CPU affinity to all cores, unless it already is (the usual default)
+                            if proc.cpu_affinity() != self._all_cpus:
+                                proc.cpu_affinity(self._all_cpus)
                             optimizations.append(f"Set CPU affinity for {process_name}")
+                            self._applied.add(applied_key)
                             
                 except Exception as e:
                     optimizations.append(f"Failed to optimize {process_name}: {str(e)}")
@@ -385,7 +512,7 @@ class GamingOptimizer:
             return {
                 'type': f'Process Priority for {game["name"]}',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -396,68 +523,70 @@ class GamingOptimizer:
         try:
             optimizations = []
             
-            game_key = game['key']
-            game_profile = self.game_profiles.get(game_key, {})
-            
-            if game_key == 'league_of_legends':
-                optimizations.append("Optimizing League of Legends settings")
-                # This would involve optimizing LoL-specific settings
-                
-            elif game_key == 'valorant':
-                optimizations.append("Optimizing Valorant settings")
-                # This would involve optimizing Valorant-specific settings
-                
-            elif game_key == 'cs2':
-                optimizations.append("Optimizing Counter-Strike 2 settings")
-                # This would involve optimizing CS2-specific settings
-                
-            elif game_key == 'fortnite':
-                optimizations.append("Optimizing Fortnite settings")
-                # This would involve optimizing Fortnite-specific settings
-                
-            elif game_key == 'apex_legends':
-                optimizations.append("Optimizing Apex Legends settings")
-                # This would involve optimizing Apex Legends-specific settings
+            tune = self._settings_dispatch.get(game['key'])
+            if tune:
+                optimizations.append(tune(game))
             
             return {
                 'type': f'Game Settings for {game["name"]}',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
             return {'type': f'Game Settings for {game["name"]}', 'error': str(e)}
     
+    def _optimize_lol_settings(self, game: Dict) -> str:
+        # This would involve optimizing LoL-specific settings
+        return "Optimizing League of Legends settings"
+    
+    def _optimize_valorant_settings(self, game: Dict) -> str:
+        # This would involve optimizing Valorant-specific settings
+        return "Optimizing Valorant settings"
+    
+    def _optimize_cs2_settings(self, game: Dict) -> str:
+        # This would involve optimizing CS2-specific settings
+        return "Optimizing Counter-Strike 2 settings"
+    
+    def _optimize_fortnite_settings(self, game: Dict) -> str:
+        # This would involve optimizing Fortnite-specific settings
+        return "Optimizing Fortnite settings"
+    
+    def _optimize_apex_settings(self, game: Dict) -> str:
+        # This would involve optimizing Apex Legends-specific settings
+        return "Optimizing Apex Legends settings"
+    
     def _optimize_anti_cheat_compatibility(self, game: Dict) -> Dict[str, any]:
         """Optimize anti-cheat compatibility"""
         try:
             optimizations = []
             
-            game_key = game['key']
-            game_profile = self.game_profiles.get(game_key, {})
-            anti_cheat = game_profile.get('anti_cheat', '')
-            
-            if anti_cheat == 'vanguard':
-                optimizations.append("Optimizing Vanguard anti-cheat compatibility")
-                # This would involve Vanguard-specific optimizations
-                
-            elif anti_cheat == 'vac':
-                optimizations.append("Optimizing VAC anti-cheat compatibility")
-                # This would involve VAC-specific optimizations
-                
-            elif anti_cheat == 'easy_anti_cheat':
-                optimizations.append("Optimizing Easy Anti-Cheat compatibility")
-                # This would involve Easy Anti-Cheat-specific optimizations
+            game_profile = self.game_profiles.get(game['key'], {})
+            tune = self._anti_cheat_dispatch.get(game_profile.get('anti_cheat', ''))
+            if tune:
+                optimizations.append(tune(game))
             
             return {
                 'type': f'Anti-Cheat Compatibility for {game["name"]}',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
             return {'type': f'Anti-Cheat Compatibility for {game["name"]}', 'error': str(e)}
     
+    def _optimize_vanguard_compatibility(self, game: Dict) -> str:
+        # This would involve Vanguard-specific optimizations
+        return "Optimizing Vanguard anti-cheat compatibility"
+    
+    def _optimize_vac_compatibility(self, game: Dict) -> str:
+        # This would involve VAC-specific optimizations
+        return "Optimizing VAC anti-cheat compatibility"
+    
+    def _optimize_eac_compatibility(self, game: Dict) -> str:
+        # This would involve Easy Anti-Cheat-specific optimizations
+        return "Optimizing Easy Anti-Cheat compatibility"
+    
     def _optimize_game_network(self, game: Dict) -> Dict[str, any]:
         """Optimize network for specific game"""
         try:
@@ -474,7 +603,7 @@ class GamingOptimizer:
             return {
                 'type': f'Network Optimization for {game["name"]}',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -497,7 +626,7 @@ class GamingOptimizer:
             return {
                 'type': 'CPU Gaming Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -520,7 +649,7 @@ class GamingOptimizer:
             return {
                 'type': 'Memory Gaming Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -543,7 +672,7 @@ class GamingOptimizer:
             return {
                 'type': 'GPU Gaming Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -566,7 +695,7 @@ class GamingOptimizer:
             return {
                 'type': 'Audio Gaming Optimization',
                 'optimizations': optimizations,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._current_ts
             }
             
         except Exception as e:
@@ -574,51 +703,150 @@ class GamingOptimizer:
     
     def _start_gaming_monitoring(self):
         """Start gaming monitoring"""
-        try:
-            self.optimization_thread = threading.Thread(target=self._gaming_monitoring_loop, daemon=True)
-            self.optimization_thread.start()
-        except:
-            pass
+        self._ticks_since_scan = 0
+        self._idle_ticks = 0
+        
+        self.optimization_thread = threading.Thread(target=self._gaming_monitoring_loop, daemon=True)
+        self.optimization_thread.start()
+    
+    def _monitor_tick(self, full_scan: bool) -> float:
+        """Run one monitoring pass; returns the seconds to wait before the next"""
+        self._current_ts = datetime.now().isoformat()
+        if full_scan:
+            # One pass over the process table serves every lookup this tick
+            snapshot = self._snapshot_processes()
+            self._ticks_since_scan = 0
+        else:
+            # Only re-check the game pids found by the last scan
+            snapshot = [(pid, name) for pid, name in self._known_game_pids.items()
+                        if psutil.pid_exists(pid)]
+            self._proc_snapshot = snapshot
+            self._ticks_since_scan += 1
+        
+        # Monitor gaming processes
+        self._monitor_gaming_processes(snapshot)
+        
+        # Update gaming optimizations
+        self._update_gaming_optimizations()
+        
+        # Update every 5 seconds while games run; back off towards 60s when idle
+        if self.detected_games:
+            self._idle_ticks = 0
+        else:
+            self._idle_ticks += 1
+        return min(60, 5 * (1 + self._idle_ticks))
+    
+    def _needs_full_scan(self) -> bool:
+        """Whether the next polling tick should walk the whole process table"""
+        # Every FULL_SCAN_TICKS ticks, or every tick while no game is running
+        return not self.detected_games or self._ticks_since_scan + 1 >= FULL_SCAN_TICKS
     
     def _gaming_monitoring_loop(self):
         """Gaming monitoring loop"""
+        # With a WMI watcher the process table is rescanned only when a game process
+        # starts or stops; otherwise it is polled
+        watcher = self._open_process_watcher()
+        full_scan = True
+        
         while self.is_optimizing:
             try:
-                # Monitor gaming processes
-                self._monitor_gaming_processes()
-                
-                # Update gaming optimizations
-                self._update_gaming_optimizations()
+                interval = self._monitor_tick(full_scan)
                 
-                time.sleep(5)  # Update every 5 seconds
+                if watcher is None:
+                    self._stop_event.wait(interval)
+                    full_scan = self._needs_full_scan()
+                else:
+                    full_scan = self._wait_for_game_event(watcher, interval)
                 
-            except:
-                time.sleep(5)
+            except Exception:
+                self._stop_event.wait(5)
+                full_scan = True
+        
+        if watcher is not None:
+            pythoncom.CoUninitialize()
+    
+    def _open_process_watcher(self):
+        """Subscribe to process start/stop events through WMI (None when unavailable)"""
+        if wmi is None:
+            return None
+        
+        try:
+            # COM must be initialised on the monitoring thread
+            pythoncom.CoInitialize()
+            return wmi.WMI().Win32_ProcessTrace.watch_for()
+        except Exception as e:
+            # Trace events need administrator rights; fall back to polling
+            log.info("Process watcher unavailable, polling instead: %s", e)
+            pythoncom.CoUninitialize()
+            return None
     
-    def _monitor_gaming_processes(self):
+    def _wait_for_game_event(self, watcher, timeout: float) -> bool:
+        """Wait up to timeout seconds for a known game process to start or stop"""
+        deadline = time.monotonic() + timeout
+        
+        while self.is_optimizing:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            
+            try:
+                # Short waits keep stop_gaming_optimization responsive
+                event = watcher(timeout_ms=int(min(remaining, 1.0) * 1000))
+            except wmi.x_wmi_timed_out:
+                continue
+            
+            if (event.ProcessName or '').lower() in self._proc_to_game:
+                return True
+        
+        return False
+    
+    def _monitor_gaming_processes(self, snapshot: Optional[List[Tuple[int, str]]] = None):
         """Monitor gaming processes"""
         try:
-            # Update detected games
-            self.detected_games = self._detect_running_games()
+            if snapshot is None:
+                snapshot = self._snapshot_processes()
             
-            # Monitor gaming processes
-            for game in self.detected_games:
-                for process_name in game['processes']:
-                    try:
-                        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                            if proc.info['name'].lower() == process_name.lower():
-                                # Monitor process performance
-                                cpu_usage = proc.info['cpu_percent']
-                                memory_usage = proc.info['memory_info'].rss / (1024 * 1024)  # MB
-                                
-                                # Log performance if needed
-                                if cpu_usage > 80 or memory_usage > 1000:
-                                    print(f"High resource usage for {process_name}: CPU {cpu_usage}%, Memory {memory_usage}MB")
-                                
-                    except:
-                        continue
+            # Update detected games in place
+            self.detected_games[:] = self._detect_running_games(snapshot)
+            
+            game_names = {process_name.lower()
+                          for game in self.detected_games for process_name in game['processes']}
+            
+            # Monitor gaming processes; metrics are read only for matched pids
+            game_procs = {}
+            known_game_pids = {}
+            for pid, process_name in snapshot:
+                if process_name.lower() not in game_names:
+                    continue
+                try:
+                    proc = self._game_procs.get(pid) or psutil.Process(pid)
+                    game_procs[pid] = proc
+                    known_game_pids[pid] = process_name
+                    
+                    # Monitor process performance; oneshot shares the underlying reads
+                    with proc.oneshot():
+                        cpu_usage = proc.cpu_percent()
+                        memory_usage = proc.memory_info().rss / (1024 * 1024)  # MB
+                    
+                    # Log performance if needed, at most once a minute per process
+                    if (cpu_usage > 80 or memory_usage > 1000) and log.isEnabledFor(logging.DEBUG):
+                        now = time.monotonic()
+                        if now - self._usage_logged.get(pid, -USAGE_LOG_INTERVAL) >= USAGE_LOG_INTERVAL:
+                            self._usage_logged[pid] = now
+                            log.debug("High resource usage for %s: CPU %s%%, Memory %.1fMB",
+                                      process_name, cpu_usage, memory_usage)
+                    
+                except (psutil.Error, OSError):
+                    continue
+            
+            # Drop handles and applied markers for processes that exited
+            self._game_procs = game_procs
+            self._known_game_pids = known_game_pids
+            self._usage_logged = {pid: ts for pid, ts in self._usage_logged.items() if pid in game_procs}
+            live_pids = {pid for pid, _ in snapshot}
+            self._applied = {entry for entry in self._applied if entry[2] in live_pids}
                         
-        except:
+        except Exception:
             pass
     
     def _update_gaming_optimizations(self):
@@ -635,6 +863,7 @@ class GamingOptimizer:
     def stop_gaming_optimization(self):
         """Stop gaming optimization"""
         self.is_optimizing = False
+        self._stop_event.set()
         if self.optimization_thread:
             self.optimization_thread.join(timeout=2)
         
@@ -645,7 +874,7 @@ class GamingOptimizer:
         try:
             return {
                 'status': 'optimizing' if self.is_optimizing else 'stopped',
-                'detected_games': self.detected_games,
+                'detected_games': list(self.detected_games),
                 'gaming_processes': len(self.gaming_processes),
                 'timestamp': datetime.now().isoformat()
             }
@@ -665,7 +894,7 @@ class GamingOptimizer:
             
             # Return simplified results for UI
             return {
-                'process_priority': 'High',
+                'process_priority': 'Above Normal',
                 'cpu_optimized': True,
                 'gpu_optimized': True,
                 'background_apps_optimized': len(results.get('detected_games', [])),
@@ -10,6 +10,11 @@ import os
 import time
 from typing import Dict, List, Optional
 
+# Seconds a detect_lol_processes scan is reused
+DETECT_CACHE_TTL = 2.0
+# Monitoring samples between full process scans while LoL is running
+FULL_SCAN_SAMPLES = 6
+
 class LoLOptimizer:
     def __init__(self):
         self.system = platform.system()
@@ -18,21 +23,36 @@ class LoLOptimizer:
             'riotclient.exe', 'leagueclient.exe', 'leagueclientux.exe'
         ]
         self.lol_ports = [2099, 5222, 5223, 8080, 8081, 8082]
+        # Entries are full executable names, so a set lookup replaces the substring scan
+        self._lol_name_set = frozenset(name.lower() for name in self.lol_processes)
+        # (monotonic time, processes) from the last scan
+        self._proc_cache = (0.0, [])
+        # Pids found by the last full scan during monitoring
+        self._known_lol_pids = set()
         
     def detect_lol_processes(self) -> List[psutil.Process]:
         """Detect League of Legends related processes"""
         lol_processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'exe']):
+        for proc in psutil.process_iter(['name']):
             try:
-                proc_name = proc.info['name'].lower()
-                if any(lol_process in proc_name for lol_process in self.lol_processes):
+                proc_name = (proc.info['name'] or '').lower()
+                if proc_name in self._lol_name_set:
                     lol_processes.append(proc)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
         return lol_processes
     
+    def _cached_detect(self, ttl: float = DETECT_CACHE_TTL) -> List[psutil.Process]:
+        """Return LoL processes, rescanning only when the last scan is older than ttl"""
+        now = time.monotonic()
+        cached_at, lol_processes = self._proc_cache
+        if now - cached_at >= ttl:
+            lol_processes = self.detect_lol_processes()
+            self._proc_cache = (now, lol_processes)
+        return lol_processes
+    
     def optimize_lol_performance(self) -> Dict[str, any]:
         """Optimize League of Legends performance"""
         results = {
@@ -44,8 +64,9 @@ class LoLOptimizer:
         }
         
         try:
-            # Detect and optimize LoL processes
-            lol_processes = self.detect_lol_processes()
+            # Detect and optimize LoL processes; always start from a fresh scan
+            self._proc_cache = (0.0, [])
+            lol_processes = self._cached_detect()
             
             for process in lol_processes:
                 try:
@@ -112,7 +133,7 @@ class LoLOptimizer:
     def get_lol_performance_metrics(self) -> Dict[str, float]:
         """Get League of Legends specific performance metrics"""
         try:
-            lol_processes = self.detect_lol_processes()
+            lol_processes = self._cached_detect()
             
             if not lol_processes:
                 return {
@@ -124,20 +145,18 @@ class LoLOptimizer:
             
             total_memory = 0
             total_cpu = 0
-            network_connections = 0
+            network_connections = self._count_lol_connections(lol_processes)
             
             for process in lol_processes:
                 try:
-                    # Memory usage
-                    memory_info = process.memory_info()
-                    total_memory += memory_info.rss / (1024 * 1024)  # MB
-                    
-                    # CPU usage
-                    total_cpu += process.cpu_percent()
-                    
-                    # Network connections
-                    connections = process.connections()
-                    network_connections += len(connections)
+                    # Read memory and CPU from one cached process snapshot
+                    with process.oneshot():
+                        # Memory usage
+                        memory_info = process.memory_info()
+                        total_memory += memory_info.rss / (1024 * 1024)  # MB
+                        
+                        # CPU usage
+                        total_cpu += process.cpu_percent()
                     
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -157,6 +176,22 @@ class LoLOptimizer:
                 'network_connections': 0
             }
     
+    def _count_lol_connections(self, lol_processes: List[psutil.Process]) -> int:
+        """Count inet connections owned by LoL processes"""
+        lol_pids = {process.pid for process in lol_processes}
+        try:
+            # One pass over the system connection table instead of one per process
+            return sum(1 for conn in psutil.net_connections(kind='inet') if conn.pid in lol_pids)
+        except psutil.AccessDenied:
+            # The system-wide table needs elevated rights on some platforms
+            network_connections = 0
+            for process in lol_processes:
+                try:
+                    network_connections += len(process.net_connections(kind='inet'))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return network_connections
+    
     def optimize_lol_settings(self) -> Dict[str, bool]:
         """Optimize League of Legends game settings"""
         results = {}
@@ -214,7 +249,20 @@ class LoLOptimizer:
         metrics_history = []
         start_time = time.time()
         
+        samples = 0
+        
         while time.time() - start_time < duration:
+            if self._known_lol_pids and samples % FULL_SCAN_SAMPLES:
+                # Only re-check the pids found by the last scan
+                lol_processes = [process for process in self._proc_cache[1]
+                                 if process.pid in self._known_lol_pids and psutil.pid_exists(process.pid)]
+                self._proc_cache = (time.monotonic(), lol_processes)
+            else:
+                self._proc_cache = (0.0, [])
+                lol_processes = self._cached_detect()
+            self._known_lol_pids = {process.pid for process in lol_processes}
+            samples += 1
+            
             metrics = self.get_lol_performance_metrics()
             metrics['timestamp'] = time.time()
             metrics_history.append(metrics)